@@ -140,8 +140,12 @@ class TimeseriesPlotter:
                        ha='center', va='center', transform=ax.transAxes)
                 continue
 
-            # Load data
-            y_data = self.timeseries_group[field_name][:]
+            # Load data (string fields decoded in one bulk read)
+            dataset = self.timeseries_group[field_name]
+            if h5py.check_string_dtype(dataset.dtype):
+                y_data = dataset.asstr()[:]
+            else:
+                y_data = dataset[:]
             y_label = self.get_field_label(field_name)
 
             # Plot
@@ -163,9 +167,7 @@ class TimeseriesPlotter:
                     ax.set_yticklabels(['Continuous', 'Light', 'Dark'])
             elif field_name in ["led_type_str", "phase_str", "capture_method"]:
                 # String data - convert to categorical for plotting
-                unique_values = np.unique(y_data)
-                value_to_int = {val: i for i, val in enumerate(unique_values)}
-                y_numeric = np.array([value_to_int[val] for val in y_data])
+                unique_values, y_numeric = np.unique(y_data, return_inverse=True)
 
                 ax.step(x_data, y_numeric, where='post', linewidth=2, label=field_name)
                 ax.set_yticks(range(len(unique_values)))
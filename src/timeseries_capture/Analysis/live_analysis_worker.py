@@ -182,14 +182,18 @@ class LiveAnalysisWorker(QThread):
             # ----------------------------------------------------------------
             # Load only new frames (small batch, e.g. ~4 frames per 20s update)
             # ----------------------------------------------------------------
-            dtype_max = float(np.iinfo(frames_arr.dtype).max)
-            new_frames = frames_arr[start_idx:n_frames].astype(np.float32) / dtype_max
-
-            # Prepend boundary frame so we get a diff at the batch seam
-            if self._boundary_frame is not None:
-                batch = np.concatenate([self._boundary_frame[np.newaxis], new_frames], axis=0)
-            else:
-                batch = new_frames  # first call — no boundary yet
+            dtype_max = np.float32(np.iinfo(frames_arr.dtype).max)
+            raw_frames = frames_arr[start_idx:n_frames]
+
+            # Normalize straight into the batch buffer, behind the boundary
+            # frame (if any) so we get a diff at the batch seam — no float
+            # temporary and no concatenate copy of the whole batch.
+            offset = 0 if self._boundary_frame is None else 1
+            batch = np.empty((offset + raw_frames.shape[0],) + raw_frames.shape[1:], np.float32)
+            if offset:
+                batch[0] = self._boundary_frame
+            new_frames = batch[offset:]
+            np.divide(raw_frames, dtype_max, out=new_frames)
 
             # ----------------------------------------------------------------
             # Always accumulate elapsed + LED for new frames — even if we
@@ -203,7 +207,12 @@ class LiveAnalysisWorker(QThread):
                 self._elapsed_acc = np.concatenate([self._elapsed_acc, new_elapsed])
 
             if ts_group is not None and "white_led_power" in ts_group:
-                new_led = ts_group["white_led_power"][start_idx:n_frames].astype(np.float32)
+                led_ds = ts_group["white_led_power"]
+                new_led = led_ds[start_idx:n_frames].astype(np.float32)
+                # Rows without a reading hold the dataset's missing_value (255)
+                missing = led_ds.attrs.get("missing_value")
+                if missing is not None:
+                    new_led[new_led == missing] = np.nan
                 self._led_power_acc = np.concatenate([self._led_power_acc, new_led])
 
             # Update boundary cache and frame counter
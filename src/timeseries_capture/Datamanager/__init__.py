@@ -13,22 +13,20 @@ Features:
 
 HDF5 Structure:
     experiment.h5
+    ├── attrs: recording_info (JSON), created, finalized, ...
     ├── /images/
-    │   ├── frame_000000  (numpy array, uncompressed)
-    │   ├── frame_000001
-    │   └── ...
-    ├── /metadata/
-    │   └── recording_info (JSON attrs)
-    ├── /timeseries/
-    │   ├── frame_index
-    │   ├── timestamps
-    │   ├── recording_elapsed_sec
-    │   ├── temperature_celsius
-    │   ├── led_type
-    │   ├── phase
-    │   └── ... (15-53 datasets depending on mode)
-    └── /phase_analysis/
-        └── transitions (attrs)
+    │   └── frames  (N × H × W, uncompressed)
+    └── /timeseries/
+        ├── frame_index
+        ├── recording_elapsed_sec
+        ├── temperature_celsius
+        ├── led_type_str
+        ├── phase_str
+        └── ... (13-36 datasets depending on mode)
+
+    Only these two groups are created per recording. /metadata/ and
+    /phase_analysis/ exist in older files only; load_recording_info() and
+    get_recording_summary() still read them when present.
 
 Telemetry Modes:
     MINIMAL       (~15 fields) - Für Tests
@@ -41,7 +39,7 @@ Usage:
     # Create manager
     data_mgr = DataManager(
         telemetry_mode=TelemetryMode.STANDARD,
-        chunk_size=512
+        chunk_size=4096
     )
 
     # Create HDF5 file
@@ -67,6 +65,9 @@ Analysis:
     # Get summary
     summary = get_recording_summary("experiment.h5")
 
+    # Units of the timeseries datasets ({"recording_elapsed_sec": "s", ...})
+    units = get_timeseries_units("experiment.h5")
+
 Version: 5.0-refactored (HDF5-based)
 """
 
@@ -75,6 +76,7 @@ from .data_manager_hdf5 import (
     DataManager,
     TelemetryMode,
     get_recording_summary,
+    get_timeseries_units,
     load_recording_info,
 )
 
@@ -89,6 +91,7 @@ __all__ = [
     # Utility Functions
     "load_recording_info",
     "get_recording_summary",
+    "get_timeseries_units",
 ]
 
 
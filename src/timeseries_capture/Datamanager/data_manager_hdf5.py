@@ -10,14 +10,19 @@ Combines the proven HDF5 storage approach with improved architecture:
 - Clean modular design
 """
 
+import functools
 import json
 import logging
+import os
 import pickle
 import queue
 import threading
 import time
+from collections import deque
+from collections.abc import Mapping
 from enum import IntEnum
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Optional
 
 import h5py
@@ -26,6 +31,139 @@ import numpy as np
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# PAGE CACHE AND DURABILITY
+# ============================================================================
+
+
+def _release_page_cache(hdf5_file: h5py.File) -> None:
+    """
+    Tell the kernel the already-written part of the file will not be re-read.
+
+    Opt-in (RecordingConfig.release_page_cache, passed on as
+    DataManager(release_page_cache=True)): the recorder itself never reads
+    frames back, but any reader of the growing file would then go to disk
+    for every read. Enable it for multi-day recordings nobody reads while
+    they run, where the page cache would otherwise fill up with image data.
+    Dirty pages are kept until written back; clean ones are dropped.
+    No-op where posix_fadvise is unavailable (Windows, macOS).
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = hdf5_file.id.get_vfd_handle()
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except Exception as e:
+        logger.debug(f"posix_fadvise skipped: {e}")
+
+
+def _open_sync_fd(hdf5_file: h5py.File) -> Optional[int]:
+    """
+    Open a second descriptor on the HDF5 file, used only for fsync.
+
+    HDF5's own VFD handle is not always usable by os.fsync: on Windows the
+    library may use a different C runtime, whose descriptors mean nothing
+    to Python's. fsync applies to the file, not to the descriptor it is
+    called on, so a separate one works on every platform.
+    """
+    try:
+        return os.open(hdf5_file.filename, os.O_RDWR)
+    except Exception as e:
+        logger.warning(f"HDF5 fsync disabled, cannot open file: {e}")
+        return None
+
+
+def _fsync_fd(fd: int) -> None:
+    """
+    Force everything flushed so far onto stable storage.
+
+    h5py's flush() only hands data to the OS; after a power loss the kernel
+    may not have written it yet. fsync is expensive, so it runs every few
+    flushes rather than with each one.
+    """
+    try:
+        os.fsync(fd)
+    except Exception as e:
+        logger.warning(f"HDF5 fsync failed: {e}")
+
+
+def _fsync_path(path: Path) -> None:
+    """
+    fsync a closed file by path.
+
+    Used once per recording after close(): close() still writes the final
+    superblock and free-space metadata, which an fsync through the open
+    HDF5 handle would miss.
+    """
+    try:
+        fd = os.open(path, os.O_RDWR)
+    except Exception as e:
+        logger.warning(f"HDF5 final fsync failed: {e}")
+        return
+    try:
+        _fsync_fd(fd)
+    finally:
+        os.close(fd)
+
+
+# ============================================================================
+# DIRECT CHUNK IMAGE WRITER
+# ============================================================================
+
+
+class _DirectImageWriter:
+    """
+    Writes frames into /images/frames one whole chunk at a time.
+
+    Consecutive frames are assembled in a (k, H, W) buffer shaped like one
+    chunk; a complete chunk goes to disk with H5Dwrite_chunk, skipping
+    HDF5's selection, type-conversion and chunk-cache path. The file layout
+    is unchanged (uncompressed, so the raw chunk is the data itself).
+
+    Frames of a chunk that is not complete yet are written the regular way
+    by flush(), so periodic flushes still make every frame visible. Frames
+    that do not fit the scheme (other dtype or shape, out of order) also
+    take the regular path.
+    """
+
+    def __init__(self, ds: h5py.Dataset):
+        self.ds = ds
+        self.k = ds.chunks[0]
+        self._buf = np.empty(ds.chunks, dtype=ds.dtype)
+        self._start = 0  # frame index of buffer slot 0
+        self._n = 0  # buffered frames, slots [0, n)
+        self._flushed = 0  # slots [0, flushed) already written the regular way
+
+    def write(self, index: int, frame: np.ndarray) -> None:
+        if self._n and index != self._start + self._n:
+            self.flush()
+            self._n = 0
+        if self._n == 0 and (
+            index % self.k or frame.dtype != self._buf.dtype or frame.shape != self._buf.shape[1:]
+        ):
+            self.ds[index] = frame
+            return
+        if self.k == 1 and frame.flags.c_contiguous:
+            self.ds.id.write_direct_chunk((index, 0, 0), frame)  # the frame is the chunk
+            return
+
+        if self._n == 0:
+            self._start = index
+            self._flushed = 0
+        self._buf[self._n] = frame
+        self._n += 1
+        if self._n == self.k:
+            self.ds.id.write_direct_chunk((self._start, 0, 0), self._buf)
+            self._n = 0
+
+    def flush(self) -> None:
+        """Write buffered frames of the incomplete chunk (regular write path)"""
+        if self._n > self._flushed:
+            lo, hi = self._start + self._flushed, self._start + self._n
+            self.ds[lo:hi] = self._buf[self._flushed : self._n]
+            self._flushed = self._n
+
+
 # ============================================================================
 # ASYNC HDF5 WRITE-BEHIND QUEUE (v2.5 Optimization)
 # ============================================================================
@@ -57,6 +195,9 @@ class AsyncHDF5Writer:
         hdf5_file: h5py.File,
         flush_interval: int = 50,
         max_queue_size: int = 32,
+        block_when_full: bool = True,
+        fsync_interval: int = 500,
+        release_page_cache: bool = False,
     ):
         """
         Args:
@@ -65,10 +206,23 @@ class AsyncHDF5Writer:
             flush_interval: Flush HDF5 buffers every N frames (default 50)
             max_queue_size: Max frames held in RAM queue (default 32).
                 Increase only if disk is consistently slower than capture rate.
+            block_when_full: If True (default), enqueue() waits for space when
+                the queue is full (back-pressure, no frame loss). If False,
+                the frame is dropped and counted instead, so the recording
+                thread never stalls on disk. A dropped frame still gets its
+                timeseries row (see _write_dropped_rows), so row i always
+                belongs to image slot i.
+            fsync_interval: fsync the file at the first flush after every N
+                frames (default 500, 0 = never)
+            release_page_cache: Drop the file's cached pages after each
+                periodic flush (default False, see _release_page_cache)
         """
         self._ts_writer = ts_writer
         self._hdf5_file = hdf5_file
         self._flush_interval = flush_interval
+        self._block_when_full = block_when_full
+        self._fsync_interval = fsync_interval
+        self._release_page_cache = release_page_cache
 
         self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
         self._shutdown_event = threading.Event()
@@ -77,8 +231,14 @@ class AsyncHDF5Writer:
         # for approximate values; finalize reads after join so exact)
         self.frames_written = 0
         self.write_errors = 0
+        self.dropped_frames = 0
         self._max_queue_depth = 0
 
+        # (frame_index, frame_metadata, esp32_timing, python_timing) of frames
+        # dropped by enqueue(), in capture order. The worker turns them into
+        # marker rows at their place in the sequence.
+        self._dropped: deque = deque()
+
         self._thread = threading.Thread(target=self._worker, daemon=True, name="HDF5-WriteWorker")
         self._thread.start()
         logger.info(
@@ -100,15 +260,19 @@ class AsyncHDF5Writer:
         frame_metadata: dict,
         esp32_timing: dict,
         python_timing: dict,
+        copy: bool = True,
     ) -> None:
         """
         Enqueue a frame write. Returns immediately unless queue is full.
 
-        frame_data is copied here so the camera buffer can be reused
-        immediately after this call returns.
+        frame_data is copied here (C-contiguous, so the worker's H5Dwrite
+        needs no second staging copy) and the camera buffer can be reused
+        immediately after this call returns. Pass copy=False for an array
+        the caller already owns exclusively, e.g. a freshly converted frame.
 
         If queue is full (disk slower than capture rate), this blocks
-        until space is available (back-pressure, no frame loss).
+        until space is available (back-pressure, no frame loss), or drops
+        the frame immediately when block_when_full is False.
         """
         depth = self._queue.qsize()
         if depth > self._max_queue_depth:
@@ -121,7 +285,10 @@ class AsyncHDF5Writer:
             )
 
         item = {
-            "frame_data": frame_data.copy(),  # decouple from camera buffer
+            # decouple from camera buffer
+            "frame_data": (
+                np.array(frame_data, order="C") if copy else np.ascontiguousarray(frame_data)
+            ),
             "frame_index": frame_index,
             "frame_number": frame_number,
             "img_ds": images_dataset,
@@ -132,6 +299,18 @@ class AsyncHDF5Writer:
             "python_timing": python_timing,
         }
 
+        if not self._block_when_full:
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                self.dropped_frames += 1
+                self._dropped.append((frame_index, frame_metadata, esp32_timing, python_timing))
+                logger.error(
+                    f"HDF5 write queue full — frame {frame_number} dropped "
+                    f"({self.dropped_frames} dropped so far)"
+                )
+            return
+
         # Block if queue full — prevents unbounded RAM growth.
         # Timeout is generous (60 s); if disk is this slow, something is wrong.
         try:
@@ -142,6 +321,7 @@ class AsyncHDF5Writer:
                 "Disk is too slow for the configured capture rate."
             )
             self.write_errors += 1
+            self._dropped.append((frame_index, frame_metadata, esp32_timing, python_timing))
 
     # ------------------------------------------------------------------
     # Shutdown
@@ -169,16 +349,45 @@ class AsyncHDF5Writer:
         else:
             logger.info(
                 f"AsyncHDF5Writer stopped (written={self.frames_written}, "
-                f"errors={self.write_errors}, peak_queue={self._max_queue_depth})"
+                f"errors={self.write_errors}, dropped={self.dropped_frames}, "
+                f"peak_queue={self._max_queue_depth})"
             )
 
     # ------------------------------------------------------------------
     # Worker thread
     # ------------------------------------------------------------------
 
+    def _write_dropped_rows(self, before: Optional[int] = None) -> None:
+        """
+        Append a marker row for every dropped frame index below `before`
+        (all of them when None).
+
+        Timeseries rows are appended in order while images are written to
+        slot frame_index, so without a row per dropped frame every later row
+        would shift against its image. The marker keeps the metadata the
+        capture side recorded for the frame (timestamps, phase, LED state),
+        with capture_method "dropped" and sync_success=False; its image slot
+        keeps the dataset fill value (0).
+        """
+        dropped = self._dropped
+        while dropped and (before is None or dropped[0][0] < before):
+            index, frame_metadata, esp32_timing, python_timing = dropped.popleft()
+            try:
+                self._ts_writer.append(
+                    frame_index=index,
+                    frame_metadata={**(frame_metadata or {}), "capture_method": "dropped"},
+                    esp32_timing={**(esp32_timing or {}), "sync_success": False},
+                    python_timing=python_timing,
+                )
+            except Exception as exc:
+                logger.error(f"AsyncHDF5Writer: marker row for dropped frame {index}: {exc}")
+
     def _worker(self) -> None:
         logger.debug("AsyncHDF5Writer worker thread started")
         frames_since_flush = 0
+        frames_since_fsync = 0
+        sync_fd = _open_sync_fd(self._hdf5_file) if self._fsync_interval else None
+        img_writer: Optional[_DirectImageWriter] = None
 
         while True:
             # Block until item available (500 ms timeout for shutdown check)
@@ -204,9 +413,15 @@ class AsyncHDF5Writer:
                     logger.warning(f"Images dataset extended to {new_size} frames")
 
                 # Write frame (O(1) — pre-allocated slot)
-                img_ds[frame_index] = item["frame_data"]
-
-                # Write 17 timeseries datasets
+                if img_writer is None or img_writer.ds is not img_ds:
+                    if img_writer is not None:
+                        img_writer.flush()
+                    img_writer = _DirectImageWriter(img_ds)
+                img_writer.write(frame_index, item["frame_data"])
+
+                # Write 17 timeseries datasets (marker rows for frames
+                # dropped before this one go first, to keep rows in order)
+                self._write_dropped_rows(before=frame_index)
                 self._ts_writer.append(
                     frame_index=frame_index,
                     frame_metadata=item["frame_metadata"],
@@ -216,14 +431,27 @@ class AsyncHDF5Writer:
 
                 self.frames_written += 1
                 frames_since_flush += 1
+                frames_since_fsync += 1
 
                 # Periodic flush (every flush_interval frames).
                 # ts_writer.flush() already flushes the entire file via
                 # self.g.file.flush(), so a second call would double the cost
                 # (file flush walks all dataset metadata and grows with N).
-                if frames_since_flush >= self._flush_interval:
+                # While a backlog is queued the flush is coalesced into a
+                # later one (up to 4 intervals), so a slow disk is not made
+                # slower by flushing between every batch it catches up on.
+                if frames_since_flush >= self._flush_interval and (
+                    self._queue.empty() or frames_since_flush >= 4 * self._flush_interval
+                ):
                     try:
+                        if img_writer is not None:
+                            img_writer.flush()
                         self._ts_writer.flush()
+                        if sync_fd is not None and frames_since_fsync >= self._fsync_interval:
+                            _fsync_fd(sync_fd)
+                            frames_since_fsync = 0
+                        if self._release_page_cache:
+                            _release_page_cache(self._hdf5_file)
                         frames_since_flush = 0
                         logger.debug(f"HDF5 flushed (total written: {self.frames_written})")
                     except Exception as flush_exc:
@@ -237,12 +465,19 @@ class AsyncHDF5Writer:
             finally:
                 self._queue.task_done()
 
+        # Frames dropped after the last written one
+        self._write_dropped_rows()
+
         # Final flush after queue drained (single call, see comment above)
         try:
+            if img_writer is not None:
+                img_writer.flush()
             self._ts_writer.flush()
             logger.info(f"AsyncHDF5Writer: final flush ({self.frames_written} frames total)")
         except Exception as exc:
             logger.error(f"AsyncHDF5Writer: final flush error: {exc}")
+        if sync_fd is not None:
+            os.close(sync_fd)
 
         logger.debug("AsyncHDF5Writer worker thread stopped")
 
@@ -371,7 +606,7 @@ class HDF5ConsolidationWorker(threading.Thread):
             self.frames_written += 1
             self._frames_since_flush += 1
             if self._frames_since_flush >= self._flush_interval:
-                self._hdf5_file.flush()
+                self._ts_writer.flush()  # writes staged rows + flushes the file
                 self._frames_since_flush = 0
         except Exception as e:
             logger.error(f"Consolidation error for {path.name}: {e}")
@@ -417,10 +652,9 @@ class HDF5ConsolidationWorker(threading.Thread):
         for path in self._temp.pending_paths():
             self._process(path)
 
-        # Final flush
+        # Final flush (ts_writer.flush() already flushes the whole file)
         try:
             self._ts_writer.flush()
-            self._hdf5_file.flush()
         except Exception as e:
             logger.warning(f"HDF5ConsolidationWorker: final flush error: {e}")
 
@@ -448,6 +682,209 @@ class TelemetryMode(IntEnum):
     COMPREHENSIVE = 3  # All ~53 fields
 
 
+# ============================================================================
+# TIMESERIES FIELD MAP
+# ============================================================================
+
+
+# Length of the fixed-length ASCII label datasets (led_type_str, phase_str,
+# sync_quality); longest expected value is "continuous". Stored per dataset
+# as the "max_length" attribute.
+_LABEL_LENGTH = 16
+
+# Labels already reported by _ascii(), so each is logged once, not per row
+_rewritten_labels: set = set()
+
+
+def _ascii(value) -> bytes:
+    """
+    Encode a label for a fixed-length ASCII dataset (never raises).
+
+    Non-ASCII characters become "?" and labels longer than _LABEL_LENGTH
+    are cut to that length, with one warning per distinct label, rather
+    than being mangled or truncated silently by h5py.
+    """
+    text = str(value)
+    raw = text.encode("ascii", "replace")
+    if len(raw) > _LABEL_LENGTH or not text.isascii():
+        if text not in _rewritten_labels:
+            _rewritten_labels.add(text)
+            logger.warning(
+                f"Timeseries label {text!r} is not ASCII or exceeds "
+                f"{_LABEL_LENGTH} characters; stored as {raw[:_LABEL_LENGTH]!r}"
+            )
+        raw = raw[:_LABEL_LENGTH]
+    return raw
+
+
+# Sentinel for "key not present" — keeps legitimate 0 / 0.0 / False values,
+# which an `a or b` fallback chain would silently replace.
+_MISSING = object()
+
+# (dataset, ((source, key), ...), converter, default)
+#   source:  "fm" frame_metadata, "et" esp32_timing, "pt" python_timing,
+#            "row" value already resolved for an earlier dataset of this row
+#   default: used when no source key is present. Timestamps default to NaN,
+#            not to the clock: append() runs on the write-behind worker, so
+#            a clock read there would be write time, not capture time.
+# Order matters: "row" sources must be resolved before they are referenced.
+_TIMESERIES_FIELD_MAP = (
+    # Indices
+    ("frame_index", (("row", "frame_index"),), int, 0),
+    # Absolute timestamps (COMPREHENSIVE)
+    (
+        "capture_timestamps",
+        (("pt", "capture_timestamp_absolute"), ("fm", "timestamp")),
+        float,
+        float("nan"),
+    ),
+    (
+        "operation_start_absolute",
+        (("pt", "operation_start_absolute"), ("row", "capture_timestamps")),
+        float,
+        float("nan"),
+    ),
+    (
+        "operation_end_absolute",
+        (("pt", "operation_end_absolute"), ("row", "capture_timestamps")),
+        float,
+        float("nan"),
+    ),
+    (
+        "expected_timestamps",
+        (("pt", "expected_time"), ("row", "capture_timestamps")),
+        float,
+        float("nan"),
+    ),
+    # Relative timestamps
+    (
+        "recording_elapsed_sec",
+        (
+            ("fm", "recording_elapsed_sec"),
+            ("pt", "recording_elapsed_sec"),
+            ("pt", "capture_elapsed_sec"),
+        ),
+        float,
+        0.0,
+    ),
+    (
+        "capture_elapsed_sec",
+        (("pt", "capture_elapsed_sec"), ("row", "recording_elapsed_sec")),
+        float,
+        0.0,
+    ),
+    # Intervals and drift
+    ("actual_intervals", (("pt", "actual_interval_sec"),), float, np.nan),
+    ("expected_intervals", (("pt", "expected_interval_sec"),), float, 5.0),
+    ("cumulative_drift_sec", (("pt", "cumulative_drift_sec"),), float, 0.0),
+    ("frame_drift_sec", (("fm", "frame_drift_sec"),), float, np.nan),
+    ("capture_overhead_sec", (("pt", "capture_overhead_sec"),), float, np.nan),
+    ("capture_delay_sec", (("fm", "capture_delay_sec"),), float, np.nan),
+    # Experiment schedule
+    ("segment_index", (("fm", "segment_index"),), int, 0),
+    ("segment_label", (("fm", "segment_label"),), str, ""),
+    # ESP32 timing (COMPREHENSIVE)
+    ("stabilization_ms", (("et", "led_stabilization_ms"),), int, -1),
+    ("capture_delay_ms", (("et", "capture_delay_ms"),), int, -1),
+    ("camera_trigger_latency_ms", (("et", "camera_trigger_latency_ms"),), int, -1),
+    # Environment
+    ("temperature_celsius", (("et", "temperature_celsius"), ("et", "temperature")), float, np.nan),
+    ("humidity_percent", (("et", "humidity_percent"), ("et", "humidity")), float, np.nan),
+    # LED state
+    ("ir_led_power", (("fm", "ir_led_power"),), int, -1),
+    ("white_led_power", (("fm", "white_led_power"),), int, -1),
+    ("led_type_str", (("et", "led_type_used"), ("fm", "led_type")), _ascii, ""),
+    ("sync_success", (("et", "sync_success"),), bool, True),
+    # Phase information
+    ("phase_str", (("fm", "phase"), ("fm", "current_phase")), _ascii, "continuous"),
+    ("cycle_number", (("fm", "cycle_number"),), int, 0),
+    ("phase_transition", (("fm", "phase_transition"),), bool, False),
+    ("transition_count", (("fm", "transition_count"),), int, 0),
+    # Frame statistics
+    ("frame_mean_intensity", (("fm", "frame_mean_intensity"), ("fm", "frame_mean")), float, 0.0),
+    # Capture quality
+    ("capture_method", (("fm", "capture_method"), ("fm", "source")), str, "unknown"),
+    ("sync_quality", (("fm", "sync_quality"),), _ascii, "excellent"),
+)
+
+# Field map source tag → position in the per-row getters tuple of append()
+_SOURCE_INDEX = {"fm": 0, "et": 1, "pt": 2, "row": 3}
+
+
+def _missing_fill_value(default, dtype) -> Any:
+    """
+    HDF5 fill value for a field whose default only marks missing data
+    (NaN or -1), or None if the default is a real value that must be written.
+
+    Unsigned datasets cannot hold -1 and fill with their maximum instead
+    (255 for the uint8 LED powers, which are 0-100 %): the sentinel must
+    never collide with a valid reading such as 0 %. The value is recorded
+    in each dataset's "missing_value" attribute.
+    """
+    dtype = np.dtype(dtype)
+    if isinstance(default, float) and np.isnan(default):
+        return np.nan if dtype.kind == "f" else None
+    if type(default) is int and default == -1:
+        if dtype.kind == "u":
+            return np.iinfo(dtype).max
+        return None if dtype.kind == "b" else -1
+    return None
+
+
+# Legacy dataset names kept as HDF5 soft links to their canonical dataset
+# (COMPREHENSIVE mode) — same data, no duplicate writes or storage
+_LEGACY_ALIASES = {
+    "temperature": "temperature_celsius",
+    "humidity": "humidity_percent",
+    "led_sync_success": "sync_success",
+    "frame_mean": "frame_mean_intensity",
+}
+
+# Upper bound for one timeseries chunk (default HDF5 chunk cache size)
+_TARGET_CHUNK_BYTES = 1024 * 1024
+
+# Rows per chunk of a compressed timeseries dataset. Each periodic flush
+# writes a partial slab, and HDF5 must inflate, patch, deflate and rewrite
+# every chunk it touches; small chunks keep that per-flush cost low.
+_COMPRESSED_CHUNK_ROWS = 512
+
+# Physical units per timeseries dataset, stored once per file as the
+# "units_json" attribute of /timeseries (string fields have no unit).
+_TIMESERIES_UNITS = {
+    "frame_index": "index",
+    "recording_elapsed_sec": "s",
+    "actual_intervals": "s",
+    "expected_intervals": "s",
+    "temperature_celsius": "degC",
+    "humidity_percent": "%",
+    "ir_led_power": "%",
+    "white_led_power": "%",
+    "cycle_number": "count",
+    "frame_mean_intensity": "a.u.",
+    "sync_success": "bool",
+    "phase_transition": "bool",
+    "cumulative_drift_sec": "s",
+    "frame_drift_sec": "s",
+    "segment_index": "index",
+    "operation_start_absolute": "s (unix epoch)",
+    "operation_end_absolute": "s (unix epoch)",
+    "expected_timestamps": "s (unix epoch)",
+    "capture_timestamps": "s (unix epoch)",
+    "capture_elapsed_sec": "s",
+    "frame_drift": "s",
+    "capture_overhead_sec": "s",
+    "capture_delay_sec": "s",
+    "stabilization_ms": "ms",
+    "capture_delay_ms": "ms",
+    "camera_trigger_latency_ms": "ms",
+    "temperature": "degC",
+    "humidity": "%",
+    "led_sync_success": "bool",
+    "transition_count": "count",
+    "frame_mean": "a.u.",
+}
+
+
 # ============================================================================
 # CHUNKED TIMESERIES WRITER
 # ============================================================================
@@ -458,6 +895,12 @@ class ChunkedTimeseriesWriter:
     Optimized chunked timeseries writer for HDF5.
     Creates extendable 1-D datasets with fixed chunk sizes.
     Supports configurable field filtering via telemetry mode.
+
+    Fields are staged row-by-row into one contiguous column per dataset
+    and written one slab per field when the columns fill or flush() is
+    called, instead of one scalar HDF5 write per field per frame. The
+    on-disk layout (one 1-D dataset per field) is unchanged, so readers
+    keep using f["timeseries/<field>"][:].
     """
 
     # LED and Phase enums
@@ -467,19 +910,28 @@ class ChunkedTimeseriesWriter:
     def __init__(
         self,
         timeseries_group: h5py.Group,
-        chunk_size: int = 512,
+        chunk_size: int = 4096,
         mode: TelemetryMode = TelemetryMode.STANDARD,
     ):
         self.g = timeseries_group
-        self.chunk_size = int(chunk_size)
+        # Rows per staging slab and per chunk of the uncompressed (string)
+        # datasets: large chunks keep the chunk index small over long
+        # recordings, but cap at 1 MiB for the widest (8-byte) field so one
+        # chunk still fits the default HDF5 chunk cache. Compressed columns
+        # use at most _COMPRESSED_CHUNK_ROWS per chunk ("chunk_rows_json").
+        self.chunk_size = max(1, min(int(chunk_size), _TARGET_CHUNK_BYTES // 8))
         self.mode = mode
         self._lock = threading.RLock()
         self.ds = {}
         self.current_capacity = 0
         self.written_frames = 0
 
-        # String type for HDF5
+        # String types for HDF5. Labels from a small fixed vocabulary are
+        # fixed-length ASCII (no global-heap entry per row, plain memcpy
+        # slabs); open-ended text (capture_method, segment_label) stays
+        # variable-length UTF-8.
         str_vlen = h5py.string_dtype(encoding="utf-8")
+        str_label = h5py.string_dtype(encoding="ascii", length=_LABEL_LENGTH)
 
         # ====================================================================
         # FIELD DEFINITIONS - Organized by category
@@ -493,10 +945,10 @@ class ChunkedTimeseriesWriter:
             "expected_intervals": np.float32,  # constant config value; float32 is plenty
             "temperature_celsius": np.float32,
             "humidity_percent": np.float32,
-            "led_type_str": str_vlen,
+            "led_type_str": str_label,
             "ir_led_power": np.uint8,  # IR LED power (0-100%)
             "white_led_power": np.uint8,  # White LED power (0-100%)
-            "phase_str": str_vlen,
+            "phase_str": str_label,
             "cycle_number": np.int16,
             "frame_mean_intensity": np.float32,
             "sync_success": np.bool_,  # binary flag
@@ -545,15 +997,17 @@ class ChunkedTimeseriesWriter:
             # Note: cumulative_drift_sec is inherited from standard_fields
             "capture_overhead_sec": np.float32,
             "capture_delay_sec": np.float32,
-            "stabilization_ms": np.float32,
-            "capture_delay_ms": np.uint8,
-            "camera_trigger_latency_ms": np.uint8,
-            "temperature": np.float32,
-            "humidity": np.float32,
-            "led_sync_success": np.bool_,  # binary flag
+            # Whole milliseconds: int16 holds up to ~32 s and the -1 "missing"
+            # marker (uint8 could neither store -1 nor exposures >255 ms)
+            "stabilization_ms": np.int16,
+            "capture_delay_ms": np.int16,
+            "camera_trigger_latency_ms": np.int16,
+            "temperature": np.float32,  # soft link → temperature_celsius
+            "humidity": np.float32,  # soft link → humidity_percent
+            "led_sync_success": np.bool_,  # soft link → sync_success
             "transition_count": np.int16,
-            "frame_mean": np.float32,
-            "sync_quality": str_vlen,
+            "frame_mean": np.float32,  # soft link → frame_mean_intensity
+            "sync_quality": str_label,
         }
 
         # Select fields based on mode
@@ -564,6 +1018,18 @@ class ChunkedTimeseriesWriter:
         else:  # COMPREHENSIVE
             fields = {**minimal_fields, **standard_fields, **comprehensive_fields}
 
+        # Legacy alias names become soft links instead of duplicate datasets
+        aliases = {name: _LEGACY_ALIASES[name] for name in fields if name in _LEGACY_ALIASES}
+        fields = {name: dtype for name, dtype in fields.items() if name not in aliases}
+
+        # Fields whose default only marks missing data are never written when
+        # missing: the dataset fill value reads back in their place
+        fills = {
+            name: _missing_fill_value(default, fields[name])
+            for name, _, _, default in _TIMESERIES_FIELD_MAP
+            if name in fields
+        }
+
         # Create all datasets
         with self._lock:
             for name, dtype in fields.items():
@@ -571,31 +1037,164 @@ class ChunkedTimeseriesWriter:
                     # Dataset exists (reopening file)
                     self.ds[name] = self.g[name]
                 else:
-                    # Create new dataset
+                    # Create new dataset. Fixed-size columns are byte-shuffled
+                    # and deflated at level 1 (both filters ship with every
+                    # HDF5 build), in chunks of at most _COMPRESSED_CHUNK_ROWS
+                    # so a flush recompresses little. Variable-length strings
+                    # hold only heap references, which do not compress.
+                    packed = h5py.check_vlen_dtype(np.dtype(dtype)) is None
+                    rows = (
+                        min(self.chunk_size, _COMPRESSED_CHUNK_ROWS) if packed else self.chunk_size
+                    )
                     self.ds[name] = self.g.create_dataset(
                         name,
                         shape=(0,),
                         maxshape=(None,),
-                        chunks=(self.chunk_size,),
+                        chunks=(rows,),
                         dtype=dtype,
-                        compression=None,  # Uncompressed for speed
-                        shuffle=False,
+                        compression="gzip" if packed else None,
+                        compression_opts=1 if packed else None,
+                        shuffle=packed,
                         fletcher32=False,
+                        fillvalue=fills.get(name),
+                    )
+                    if fills.get(name) is not None:
+                        self.ds[name].attrs["missing_value"] = self.ds[name].dtype.type(fills[name])
+                    if self.ds[name].dtype.kind == "S":
+                        self.ds[name].attrs["max_length"] = self.ds[name].dtype.itemsize
+
+            for alias, target in aliases.items():
+                if alias not in self.g:
+                    self.g[alias] = h5py.SoftLink(self.ds[target].name)
+
+            # Units and dtypes as two JSON attributes (one metadata write each)
+            # instead of one attribute per field
+            if "units_json" not in self.g.attrs:
+                self.g.attrs["units_json"] = json.dumps(
+                    {
+                        name: _TIMESERIES_UNITS[name]
+                        for name in (*fields, *aliases)
+                        if name in _TIMESERIES_UNITS
+                    }
+                )
+                self.g.attrs["schema_json"] = json.dumps(
+                    {name: str(self.ds[name].dtype) for name in fields}
+                )
+                # Rows per HDF5 chunk, per dataset: compressed columns use
+                # shorter chunks than the staging slab (chunk_size)
+                self.g.attrs["chunk_rows_json"] = json.dumps(
+                    {name: self.ds[name].chunks[0] for name in fields}
+                )
+
+            # Staging buffers: one contiguous column per dataset (struct of
+            # arrays, like the file itself), so a slab write hands h5py a
+            # contiguous array in the dataset's own dtype: no gather copy out
+            # of interleaved records and no HDF5 type conversion. dtypes are
+            # taken from the datasets as they exist on disk (reopened files
+            # may differ from `fields`); vlen strings stage as objects.
+            self._column_names = tuple(fields)
+            self._fills = tuple(fills.get(name) for name in self._column_names)
+            self._columns = tuple(
+                (
+                    np.zeros(self.chunk_size, dtype=self.ds[name].dtype)
+                    if fill is None
+                    else np.full(self.chunk_size, fill, dtype=self.ds[name].dtype)
+                )
+                for name, fill in zip(self._column_names, self._fills)
+            )
+            self._staged_rows = 0
+
+            # Per column: does the current slab hold any real value? Slabs of
+            # skip-if-missing fields that stayed blank are not written
+            self._clean_slab = [fill is None for fill in self._fills]
+            self._dirty = list(self._clean_slab)
+
+            # Per-row scratch for resolved values (the "row" fallback source),
+            # reused across append() calls instead of a new dict per frame
+            self._resolved: dict = {}
+
+            # Write target per field, resolved once: staged column and its
+            # index, or neither (only resolved as a fallback source for later
+            # fields). Fields this mode neither
+            # writes nor uses as a fallback are dropped from the plan, so
+            # append() only ever touches the active schema.
+            # float() is dropped (converter None) where the target is a float
+            # column or a row fallback: the staged column coerces on assignment.
+            column_pos = {name: pos for pos, name in enumerate(self._column_names)}
+            needed = set(self.ds)
+            plan = []
+            for name, keys, convert, default in reversed(_TIMESERIES_FIELD_MAP):
+                if name not in needed:
+                    continue
+                needed.update(key for src, key in keys if src == "row")
+                column = self._columns[column_pos[name]] if name in column_pos else None
+                if convert is float and (column is None or column.dtype.kind == "f"):
+                    convert = None
+                plan.append(
+                    (
+                        name,
+                        tuple((_SOURCE_INDEX[src], key) for src, key in keys),
+                        convert,
+                        default,
+                        column_pos.get(name),
+                        column,
+                        fills.get(name) is not None,
                     )
+                )
+            self._field_plan = tuple(reversed(plan))
 
             logger.info(
-                f"Timeseries writer initialized: {len(self.ds)} datasets, mode={mode.name}, chunk_size={chunk_size}"
+                f"Timeseries writer initialized: {len(self.ds)} datasets, mode={mode.name}, chunk_size={self.chunk_size}"
             )
 
     def _ensure_capacity(self, need_rows: int):
-        """Ensure datasets have enough capacity"""
+        """
+        Ensure datasets have enough capacity.
+
+        Grows geometrically (doubling, at most 64 chunks per step) so a
+        recording that outruns its preallocation resizes every dataset a
+        handful of times, not once per chunk; trim_to_actual_size() drops
+        the unused tail at the end.
+        """
         if need_rows <= self.current_capacity:
             return
-        new_cap = max(need_rows, self.current_capacity + self.chunk_size)
+        step = min(max(self.current_capacity, self.chunk_size), 64 * self.chunk_size)
+        new_cap = max(need_rows, self.current_capacity + step)
         for ds in self.ds.values():
             ds.resize((new_cap,))
         self.current_capacity = new_cap
 
+    def preallocate(self, n_rows: int):
+        """
+        Resize all datasets to n_rows once, up front.
+
+        Call with the planned frame count so appends never have to grow the
+        datasets; trim_to_actual_size() removes the unused tail at the end.
+        """
+        with self._lock:
+            if n_rows <= self.current_capacity:
+                return
+            for ds in self.ds.values():
+                ds.resize((n_rows,))
+            self.current_capacity = n_rows
+            logger.info(f"Timeseries datasets pre-allocated to {n_rows} rows")
+
+    def _write_staged_rows(self):
+        """Write staged rows to their datasets (one slab per field)"""
+        n = self._staged_rows
+        if n == 0:
+            return
+        start = self.written_frames - n
+        for name, column, fill, dirty in zip(
+            self._column_names, self._columns, self._fills, self._dirty
+        ):
+            if dirty:
+                self.ds[name][start : start + n] = column[:n]
+                if fill is not None:
+                    column[:n] = fill  # reset for the next slab
+        self._dirty = list(self._clean_slab)
+        self._staged_rows = 0
+
     def append(
         self, frame_index: int, frame_metadata: dict, esp32_timing: dict, python_timing: dict
     ):
@@ -612,175 +1211,53 @@ class ChunkedTimeseriesWriter:
             i = self.written_frames
             self._ensure_capacity(i + 1)
 
-            # Extract data from dicts
-            fm = frame_metadata or {}
-            et = esp32_timing or {}
-            pt = python_timing or {}
-
-            # Helper to safely set dataset value
-            def set_value(key, value):
-                if key in self.ds:
-                    self.ds[key][i] = value
-
-            # ============================================================
-            # INDICES
-            # ============================================================
-            set_value("frame_index", int(frame_index))
-
-            # ============================================================
-            # ABSOLUTE TIMESTAMPS - Removed timestamps field (use recording_elapsed_sec)
-            # ============================================================
-            # Calculate timestamp for COMPREHENSIVE mode only
-            timestamp_abs = float(
-                pt.get("capture_timestamp_absolute") or fm.get("timestamp") or time.time()
-            )
-
-            if self.mode == TelemetryMode.COMPREHENSIVE:
-                set_value(
-                    "operation_start_absolute",
-                    float(pt.get("operation_start_absolute", timestamp_abs)),
-                )
-                set_value(
-                    "operation_end_absolute", float(pt.get("operation_end_absolute", timestamp_abs))
-                )
-                set_value("expected_timestamps", float(pt.get("expected_time", timestamp_abs)))
-                set_value("capture_timestamps", timestamp_abs)
-
-            # ============================================================
-            # RELATIVE TIMESTAMPS
-            # ============================================================
-            recording_elapsed = float(
-                fm.get("recording_elapsed_sec")
-                or pt.get("recording_elapsed_sec")
-                or pt.get("capture_elapsed_sec")
-                or 0.0
+            if self._staged_rows == self.chunk_size:
+                self._write_staged_rows()
+            k = self._staged_rows
+
+            # Safe to reuse: values are copied into the staged columns below
+            resolved = self._resolved
+            resolved.clear()
+            resolved["frame_index"] = frame_index
+            # Bound .get per source, indexed by _SOURCE_INDEX in the field loop
+            getters = (
+                (frame_metadata or {}).get,
+                (esp32_timing or {}).get,
+                (python_timing or {}).get,
+                resolved.get,
             )
-            set_value("recording_elapsed_sec", recording_elapsed)
 
-            if self.mode == TelemetryMode.COMPREHENSIVE:
-                set_value(
-                    "capture_elapsed_sec", float(pt.get("capture_elapsed_sec", recording_elapsed))
-                )
+            # Resolve every field from its first present source key (see
+            # _TIMESERIES_FIELD_MAP) into its staged column. Missing fields with
+            # a fill value are skipped entirely.
+            # Hot loop: module global, attributes and dict methods bound to locals once per row
+            missing = _MISSING
+            dirty = self._dirty
+            for name, keys, convert, default, pos, column, skip in self._field_plan:
+                for src, key in keys:
+                    value = getters[src](key, missing)
+                    if value is not missing and value is not None:
+                        break
+                else:
+                    if skip:
+                        continue
+                    value = default
+                if convert is not None:
+                    value = convert(value)
+                resolved[name] = value
 
-            # ============================================================
-            # INTERVALS
-            # ============================================================
-            actual_interval = float(pt.get("actual_interval_sec", np.nan))
-            expected_interval = float(pt.get("expected_interval_sec", 5.0))
-
-            set_value("actual_intervals", actual_interval)
-            set_value("expected_intervals", expected_interval)
-
-            # ============================================================
-            # TIMING DRIFT (STANDARD and COMPREHENSIVE modes)
-            # ============================================================
-            if self.mode in [TelemetryMode.STANDARD, TelemetryMode.COMPREHENSIVE]:
-                cumulative_drift = float(pt.get("cumulative_drift_sec", 0.0))
-                set_value("cumulative_drift_sec", cumulative_drift)
-                set_value("frame_drift_sec", float(fm.get("frame_drift_sec", np.nan)))
-                set_value("segment_index", int(fm.get("segment_index", 0)))
-                set_value("segment_label", str(fm.get("segment_label", "")))
-
-            # ============================================================
-            # OPERATION METRICS (removed - not needed)
-            # ============================================================
-            # All operation timing fields removed for streamlined mode
-
-            if self.mode == TelemetryMode.COMPREHENSIVE:
-                set_value("capture_overhead_sec", float(pt.get("capture_overhead_sec", np.nan)))
-                set_value("capture_delay_sec", float(fm.get("capture_delay_sec", np.nan)))
-
-            # ============================================================
-            # ESP32 TIMING
-            # ============================================================
-            # Extract values for COMPREHENSIVE mode (constants, not saved in MINIMAL/STANDARD)
-            if self.mode == TelemetryMode.COMPREHENSIVE:
-                led_stab_ms = int(et.get("led_stabilization_ms", -1))
-                set_value("stabilization_ms", led_stab_ms)
-                set_value("capture_delay_ms", int(et.get("capture_delay_ms", -1)))
-                set_value("camera_trigger_latency_ms", int(et.get("camera_trigger_latency_ms", -1)))
-
-            # ============================================================
-            # ENVIRONMENTAL DATA
-            # ============================================================
-            temp = float(et.get("temperature_celsius") or et.get("temperature", np.nan))
-            humidity = float(et.get("humidity_percent") or et.get("humidity", np.nan))
-
-            set_value("temperature_celsius", temp)
-            set_value("humidity_percent", humidity)
-
-            if self.mode == TelemetryMode.COMPREHENSIVE:
-                set_value("temperature", temp)
-                set_value("humidity", humidity)
-
-            # ============================================================
-            # LED STATE
-            # ============================================================
-            led_type_str = str(et.get("led_type_used") or fm.get("led_type", ""))
-
-            ir_led_power = int(fm.get("ir_led_power", -1))
-            white_led_power = int(fm.get("white_led_power", -1))
-
-            set_value("ir_led_power", ir_led_power)
-            set_value("white_led_power", white_led_power)
-            set_value("led_type_str", led_type_str)  # Keep only string version, removed enum
-
-            # Removed: led_mode (can infer from led_type: dual/ir/white)
-
-            sync_success = bool(et.get("sync_success", True))
-            set_value("sync_success", sync_success)
-
-            if self.mode == TelemetryMode.COMPREHENSIVE:
-                set_value("led_sync_success", sync_success)
-
-            # Removed: timeout_occurred (sync_success is sufficient)
-
-            # ============================================================
-            # PHASE INFORMATION
-            # ============================================================
-            phase_str = str(fm.get("phase") or fm.get("current_phase", "continuous"))
-
-            set_value("phase_str", phase_str)  # Keep only string version, removed enum
-            set_value("cycle_number", int(fm.get("cycle_number", 0)))
-
-            if self.mode >= TelemetryMode.STANDARD:
-                # Keep only phase_transition (as requested)
-                set_value("phase_transition", bool(fm.get("phase_transition", False)))
-
-            # Removed: phase_enabled, total_cycles, phase_elapsed_min, phase_remaining_min
-            # These are either obvious from data or can be calculated
-
-            if self.mode == TelemetryMode.COMPREHENSIVE:
-                set_value("transition_count", int(fm.get("transition_count", 0)))
-
-            # ============================================================
-            # FRAME STATISTICS
-            # ============================================================
-            frame_mean = float(fm.get("frame_mean_intensity") or fm.get("frame_mean", 0.0))
-            set_value("frame_mean_intensity", frame_mean)
-
-            if self.mode == TelemetryMode.COMPREHENSIVE:
-                set_value("frame_mean", frame_mean)
-
-            # Removed: frame_std, frame_min, frame_max
-            # These can be calculated post-hoc if needed
-
-            # ============================================================
-            # CAPTURE QUALITY
-            # ============================================================
-            if self.mode >= TelemetryMode.STANDARD:
-                capture_method = str(fm.get("capture_method") or fm.get("source", "unknown"))
-                set_value("capture_method", capture_method)
-
-            if self.mode == TelemetryMode.COMPREHENSIVE:
-                sync_quality = str(fm.get("sync_quality", "excellent"))
-                set_value("sync_quality", sync_quality)
+                if column is not None:
+                    column[k] = value
+                    dirty[pos] = True
 
-            self.written_frames += 1
+            self._staged_rows = k + 1
+            self.written_frames = i + 1
 
     def flush(self):
-        """Flush all datasets"""
+        """Write staged rows and flush all datasets"""
         try:
+            with self._lock:
+                self._write_staged_rows()
             if self.g and self.g.file:
                 self.g.file.flush()
         except Exception as e:
@@ -792,6 +1269,8 @@ class ChunkedTimeseriesWriter:
         Call this when recording is finished to remove excess allocated space.
         """
         try:
+            with self._lock:
+                self._write_staged_rows()
             if self.written_frames < self.current_capacity:
                 logger.info(
                     f"Trimming datasets from {self.current_capacity} to {self.written_frames} frames"
@@ -808,6 +1287,7 @@ class ChunkedTimeseriesWriter:
         return {
             "written_frames": self.written_frames,
             "current_capacity": self.current_capacity,
+            "staged_rows": self._staged_rows,
             "dataset_count": len(self.ds),
             "mode": self.mode.name,
             "chunk_size": self.chunk_size,
@@ -826,17 +1306,14 @@ class DataManager:
     HDF5 Structure:
     experiment_name.h5
     ├── /images/
-    │   ├── frame_000000 (dataset: raw numpy array, uncompressed)
-    │   ├── frame_000001
-    │   └── ...
+    │   └── frames (dataset: N × H × W raw frames, uncompressed)
     └── /timeseries/
         ├── frame_index
-        ├── timestamps
         ├── recording_elapsed_sec
         ├── temperature_celsius
-        ├── led_type
-        ├── phase
-        └── ... (15-19 datasets depending on mode)
+        ├── led_type_str
+        ├── phase_str
+        └── ... (13-36 datasets depending on mode)
 
     File-level attributes store recording metadata.
     """
@@ -844,21 +1321,36 @@ class DataManager:
     def __init__(
         self,
         telemetry_mode: TelemetryMode = TelemetryMode.STANDARD,
-        chunk_size: int = 10,
+        chunk_size: int = 4096,
         flush_interval: int = 10,
         save_as_uint8: bool = False,
+        block_when_queue_full: bool = True,
+        fsync_interval: int = 500,
+        release_page_cache: bool = False,
     ):
         """
         Args:
             telemetry_mode: Level of telemetry detail
-            chunk_size: Chunk size for timeseries datasets
+            chunk_size: Rows per timeseries write slab and per chunk of string
+                datasets (capped at 1 MiB per chunk); compressed numeric
+                datasets use shorter chunks, see /timeseries "chunk_rows_json"
             flush_interval: Flush HDF5 buffers every N frames (default: 10)
             save_as_uint8: Convert 12-bit HIK frames to uint8 before saving
+            block_when_queue_full: Wait for the write queue when disk falls
+                behind (default) instead of dropping frames to keep cadence
+            fsync_interval: fsync the file to disk every N frames, at the next
+                flush (default: 500, 0 = never)
+            release_page_cache: Drop written file pages from the OS page cache
+                after each periodic flush (default: False). Leave off while
+                live analysis reads the recording back.
         """
         self.telemetry_mode = telemetry_mode
         self.chunk_size = chunk_size
         self.flush_interval = flush_interval
         self.save_as_uint8 = save_as_uint8
+        self.block_when_queue_full = block_when_queue_full
+        self.fsync_interval = fsync_interval
+        self.release_page_cache = release_page_cache
 
         # HDF5 file
         self.hdf5_file: Optional[h5py.File] = None
@@ -912,9 +1404,14 @@ class DataManager:
             Path to created file
         """
         with self._hdf5_lock:
+            # One clock read for the filename and the "created" attributes,
+            # so they always agree
+            created = time.time()
+            created_local = time.localtime(created)
+
             # Generate filename
             if timestamped:
-                ts_tag = time.strftime("%Y%m%d_%H%M%S")
+                ts_tag = time.strftime("%Y%m%d_%H%M%S", created_local)
                 filename = f"{experiment_name}_{ts_tag}.h5"
                 output_path = Path(output_dir) / ts_tag
             else:
@@ -944,34 +1441,43 @@ class DataManager:
                 #                          evicting on every write.
                 #   rdcc_nslots=10007    → prime, ~10× default, reduces hash
                 #                          collisions in the chunk cache index.
+                #   rdcc_w0=1.0          → evict fully written chunks first.
+                #                          Data is written once, in order, and
+                #                          never re-read while recording, so a
+                #                          finished chunk has no reuse value;
+                #                          the partially filled chunk stays
+                #                          cached and never read-modify-writes.
                 # ----------------------------------------------------------
+                chunk_cache_bytes = 64 * 1024 * 1024
                 self.hdf5_file = h5py.File(
                     self.current_filepath,
                     "w",
                     libver="latest",
                     fs_strategy="page",
                     fs_page_size=4 * 1024 * 1024,
-                    rdcc_nbytes=64 * 1024 * 1024,
+                    rdcc_nbytes=chunk_cache_bytes,
                     rdcc_nslots=10007,
-                    rdcc_w0=0.75,
+                    rdcc_w0=1.0,
                 )
 
-                # Create groups
-                self.hdf5_file.create_group("images")
-                self.hdf5_file.create_group("timeseries")
+                # Create groups (track_order=False: no creation-order index
+                # to maintain on every link insert)
+                self.hdf5_file.create_group("images", track_order=False)
+                self.hdf5_file.create_group("timeseries", track_order=False)
 
                 # File attributes
-                self.hdf5_file.attrs["created"] = time.time()
-                self.hdf5_file.attrs["created_human"] = time.strftime("%Y-%m-%d %H:%M:%S")
+                self.hdf5_file.attrs["created"] = created
+                self.hdf5_file.attrs["created_human"] = time.strftime(
+                    "%Y-%m-%d %H:%M:%S", created_local
+                )
                 self.hdf5_file.attrs["experiment_name"] = experiment_name
-                self.hdf5_file.attrs["file_version"] = "5.1-paged-fs"
+                self.hdf5_file.attrs["file_version"] = "5.3-fixed-labels"
                 self.hdf5_file.attrs["software"] = "nematostella-timelapse-refactored"
                 self.hdf5_file.attrs["structure"] = "phase_aware_timeseries_chunked"
                 self.hdf5_file.attrs["phase_support"] = True
                 self.hdf5_file.attrs["memory_optimized"] = True
                 self.hdf5_file.attrs["chunked_datasets"] = True
                 self.hdf5_file.attrs["telemetry_mode"] = self.telemetry_mode.name
-                self.hdf5_file.attrs["chunk_size"] = self.chunk_size
 
                 # Initialize counters
                 self.frame_count = 0
@@ -988,6 +1494,8 @@ class DataManager:
                     "interval_seconds": 0,
                     "phase_enabled": False,
                     "telemetry_mode": self.telemetry_mode.name,
+                    # RAM held by the writer's HDF5 chunk cache (per open dataset, at most)
+                    "chunk_cache_bytes": chunk_cache_bytes,
                 }
 
                 logger.info(f"HDF5 file created: {self.current_filepath}")
@@ -999,10 +1507,19 @@ class DataManager:
                 raise
 
     def set_recording_config(self, config: dict):
-        """Store recording configuration."""
+        """Store recording configuration and set up the timeseries datasets."""
         self.recording_metadata.update(config)
         logger.debug(f"Recording config updated: {config}")
 
+        # Create (and pre-size) the timeseries datasets now, before recording
+        # starts, instead of on the capture thread with the first frame.
+        # HDF5 is single-writer and not thread-safe: the file structure is
+        # complete and flushed before anything reacts to recording_started.
+        with self._hdf5_lock:
+            if self.hdf5_file is not None and self._ts_writer is None:
+                self._create_timeseries_writer()
+                self.hdf5_file.flush()
+
     def save_frame(self, frame: np.ndarray, frame_number: int, metadata: dict) -> bool:
         """
         Enqueue a frame for background write (v2.5 write-behind queue).
@@ -1014,7 +1531,9 @@ class DataManager:
 
         Returns True immediately after enqueue (before disk write completes).
         """
-        if not self.hdf5_file:
+        # Identity check only: truth-testing an h5py object is an HDF5 call
+        # that waits on h5py's global lock, i.e. on the worker's frame write
+        if self.hdf5_file is None:
             logger.error("No HDF5 file open")
             return False
 
@@ -1028,6 +1547,43 @@ class DataManager:
         # timestamp used for actual_interval and recording_elapsed_sec.
         current_time = time.time()
 
+        # ----------------------------------------------------------
+        # Per-pixel work reads only the frame, so it runs before taking
+        # _hdf5_lock: get_stats() / finalize never wait on a full-frame
+        # reduction or the uint8 conversion.
+        # ----------------------------------------------------------
+        try:
+            frame_stats = self._calculate_frame_statistics(frame)
+
+            # Frame data is copied inside enqueue() so the camera buffer can
+            # be reused immediately after this call returns, unless the
+            # uint8 conversion below already produced a private copy.
+            frame_is_private = False
+            if self.save_as_uint8 and frame.dtype != np.uint8:
+                frame_is_private = True
+                if frame.dtype.kind == "f":
+                    # Float data (e.g., ImSwitch normalized [0, 1]) → scale to uint8
+                    frame = (frame * 255.0).clip(0, 255).astype(np.uint8)
+                    if self._uint8_shift is None:
+                        self._uint8_shift = -1  # sentinel: float path used
+                        logger.info("uint8 conversion: float [0,1] → scaled to [0,255]")
+                else:
+                    if self._uint8_shift is None:
+                        max_val = int(frame.max())
+                        if max_val > 4095:
+                            self._uint8_shift = 8  # 16-bit camera
+                        elif max_val > 255:
+                            self._uint8_shift = 4  # 12-bit camera
+                        else:
+                            self._uint8_shift = 0  # 8-bit data in uint16 container
+                        logger.info(
+                            f"uint8 conversion: frame max={max_val}, shift={self._uint8_shift} bits"
+                        )
+                    frame = (frame >> self._uint8_shift).astype(np.uint8)
+        except Exception as e:
+            logger.error(f"Failed to prepare frame {frame_number}: {e}")
+            return False
+
         with self._hdf5_lock:
             try:
                 # Lazy init of HDF5 structures on first frame
@@ -1051,6 +1607,9 @@ class DataManager:
                         hdf5_file=self.hdf5_file,  # type: ignore[arg-type]
                         flush_interval=self.flush_interval,
                         max_queue_size=64,  # 64 × 5 s = 320 s of buffering headroom
+                        block_when_full=self.block_when_queue_full,
+                        fsync_interval=self.fsync_interval,
+                        release_page_cache=self.release_page_cache,
                     )
 
                 # ----------------------------------------------------------
@@ -1060,7 +1619,6 @@ class DataManager:
                 timing_metrics = self._calculate_timing_metrics(
                     frame_number, current_time, metadata
                 )
-                frame_stats = self._calculate_frame_statistics(frame)
                 phase_metadata = self._process_phase_info(frame_number, metadata)
 
                 frame_metadata = {
@@ -1072,11 +1630,10 @@ class DataManager:
                     "timestamp": current_time,
                 }
 
+                # Only keys the timeseries field map reads: this dict is built
+                # per frame and handed to the write queue, so it cannot be pooled
                 esp32_timing = {
-                    "exposure_ms": metadata.get("exposure_ms", 10),
                     "led_stabilization_ms": metadata.get("led_stabilization_ms", 1000),
-                    "led_duration_ms": metadata.get("led_duration_ms", 0),
-                    "sync_timing_ms": metadata.get("led_timing_ms", 0),
                     "temperature_celsius": metadata.get("temperature", 0.0),
                     "humidity_percent": metadata.get("humidity", 0.0),
                     "led_type_used": metadata.get("led_type", "unknown"),
@@ -1092,40 +1649,18 @@ class DataManager:
                 # Use capture-based elapsed time, not save-time clock, so I/O
                 # latency does not inflate the measured inter-frame interval.
                 # ----------------------------------------------------------
+                # frame_count counts frame slots: a frame the write queue
+                # drops still gets its (empty) image slot and a marker row,
+                # so images and timeseries both end up frame_count long.
                 self.frame_count += 1
                 self.last_frame_time = timing_metrics["recording_elapsed_sec"]
 
-                # ----------------------------------------------------------
-                # Enqueue for background write — returns in microseconds.
-                # Frame data is copied inside enqueue() so camera buffer
-                # can be reused immediately after this call returns.
-                # ----------------------------------------------------------
-                if self.save_as_uint8 and frame.dtype != np.uint8:
-                    if frame.dtype.kind == "f":
-                        # Float data (e.g., ImSwitch normalized [0, 1]) → scale to uint8
-                        frame = (frame * 255.0).clip(0, 255).astype(np.uint8)
-                        if self._uint8_shift is None:
-                            self._uint8_shift = -1  # sentinel: float path used
-                            logger.info("uint8 conversion: float [0,1] → scaled to [0,255]")
-                    else:
-                        if self._uint8_shift is None:
-                            max_val = int(frame.max())
-                            if max_val > 4095:
-                                self._uint8_shift = 8  # 16-bit camera
-                            elif max_val > 255:
-                                self._uint8_shift = 4  # 12-bit camera
-                            else:
-                                self._uint8_shift = 0  # 8-bit data in uint16 container
-                            logger.info(
-                                f"uint8 conversion: frame max={max_val}, shift={self._uint8_shift} bits"
-                            )
-                        frame = (frame >> self._uint8_shift).astype(np.uint8)
-
                 # Snapshot local refs so we can call enqueue() after releasing the lock.
                 # enqueue() may block (queue.put with 60s timeout) when the disk is
                 # slow — holding _hdf5_lock during that wait would freeze any other
                 # consumer (e.g. GUI get_stats()) for the same duration.
                 frame_to_enqueue = frame
+                copy_frame = not frame_is_private
                 async_writer = self._async_writer
                 images_dataset_ref = self._images_dataset
                 image_shape_ref = self._image_shape
@@ -1151,6 +1686,7 @@ class DataManager:
                 frame_metadata=frame_metadata,
                 esp32_timing=esp32_timing,
                 python_timing=timing_metrics,
+                copy=copy_frame,
             )
             logger.debug(f"Frame {frame_number} enqueued for async write")
             return True
@@ -1170,9 +1706,13 @@ class DataManager:
             ts_group.attrs["description"] = "Chunked timeseries data"
             ts_group.attrs["x_axis"] = "recording_elapsed_sec"
             ts_group.attrs["phase_support"] = True
-            ts_group.attrs["chunk_size"] = self.chunk_size
             ts_group.attrs["telemetry_mode"] = self.telemetry_mode.name
 
+            # Size datasets from the recording plan in one resize per dataset
+            expected_frames = int(self.recording_metadata.get("expected_frames") or 0)
+            if expected_frames > 0:
+                self._ts_writer.preallocate(expected_frames)
+
             logger.info("Timeseries writer created")
 
         except Exception as e:
@@ -1244,44 +1784,18 @@ class DataManager:
 
     def _calculate_frame_statistics(self, frame: np.ndarray) -> dict:
         """
-        Calculate frame statistics (v2.4 optimization).
-
-        Only performs expensive calculations (std, min, max) in COMPREHENSIVE mode.
-        In MINIMAL/STANDARD modes, only calculates mean (used for calibration).
+        Calculate the frame mean (used for calibration and basic telemetry).
 
-        This reduces per-frame overhead by ~20-30ms in STANDARD mode.
+        Only the mean is computed, in every telemetry mode: no timeseries
+        dataset stores std, min or max, so computing them would be wasted
+        work on the capture thread.
         """
         try:
-            # Always calculate mean (needed for calibration and basic telemetry)
             frame_mean = float(np.mean(frame))
-
-            # Only calculate expensive stats in COMPREHENSIVE mode
-            if self.telemetry_mode == TelemetryMode.COMPREHENSIVE:
-                return {
-                    "frame_mean": frame_mean,
-                    "frame_mean_intensity": frame_mean,
-                    "frame_std": float(np.std(frame)),
-                    "frame_min": float(np.min(frame)),
-                    "frame_max": float(np.max(frame)),
-                }
-            else:
-                # MINIMAL/STANDARD: Skip expensive calculations
-                return {
-                    "frame_mean": frame_mean,
-                    "frame_mean_intensity": frame_mean,
-                    "frame_std": 0.0,  # Not calculated
-                    "frame_min": 0.0,  # Not calculated
-                    "frame_max": 0.0,  # Not calculated
-                }
+            return {"frame_mean": frame_mean, "frame_mean_intensity": frame_mean}
         except Exception as e:
             logger.warning(f"Frame statistics calculation failed: {e}")
-            return {
-                "frame_mean": 0.0,
-                "frame_mean_intensity": 0.0,
-                "frame_std": 0.0,
-                "frame_min": 0.0,
-                "frame_max": 0.0,
-            }
+            return {"frame_mean": 0.0, "frame_mean_intensity": 0.0}
 
     def _process_phase_info(self, frame_number: int, metadata: dict) -> dict:
         """Process phase information and detect transitions"""
@@ -1317,7 +1831,11 @@ class DataManager:
 
         HDF5 structure:
             OLD: /images/frame_000000, /images/frame_000001, ... (B-tree explosion)
-            NEW: /images/frames  shape=(max_frames, H, W), chunked=(1, H, W)
+            NEW: /images/frames  shape=(max_frames, H, W), chunked=(k, H, W)
+
+        max_frames is the planned frame count when set_recording_config()
+        provided one, else _images_max_frames; the writer grows the dataset
+        if a recording runs longer.
 
         Args:
             frame: First frame - used to determine shape and dtype
@@ -1338,19 +1856,24 @@ class DataManager:
 
         images_group = self.hdf5_file["images"]  # type: ignore[index]
 
+        expected_frames = int(self.recording_metadata.get("expected_frames") or 0)
+        max_frames = expected_frames if expected_frames > 0 else self._images_max_frames
+
         self._images_dataset = images_group.create_dataset(
             "frames",
-            shape=(self._images_max_frames, h, w),
+            shape=(max_frames, h, w),
             maxshape=(None, h, w),  # Unlimited along frame axis
             dtype=dtype,
             chunks=chunk_shape,
             compression=None,  # Uncompressed for write speed
+            shuffle=False,
+            fletcher32=False,
         )
 
         self._images_dataset.attrs["frame_height"] = h
         self._images_dataset.attrs["frame_width"] = w
         self._images_dataset.attrs["frame_dtype"] = str(dtype)
-        self._images_dataset.attrs["max_preallocated"] = self._images_max_frames
+        self._images_dataset.attrs["max_preallocated"] = max_frames
         self._images_dataset.attrs["storage_format"] = "preallocated_3d"
 
         images_group.attrs["frame_shape"] = [h, w]
@@ -1358,16 +1881,18 @@ class DataManager:
         images_group.attrs["storage_format"] = "preallocated_3d"
 
         logger.info(
-            f"Pre-allocated images dataset: ({self._images_max_frames}, {h}, {w}) "
+            f"Pre-allocated images dataset: ({max_frames}, {h}, {w}) "
             f"dtype={dtype}, chunk={chunk_shape}"
         )
 
     def flush_file(self):
-        """Flush HDF5 file to disk"""
+        """Flush HDF5 file to disk (staged timeseries rows included)"""
         try:
+            # ts_writer.flush() writes the partial staging buffer and flushes
+            # the whole file; a second file flush would only repeat the work
             if self._ts_writer:
                 self._ts_writer.flush()
-            if self.hdf5_file:
+            elif self.hdf5_file:
                 self.hdf5_file.flush()
         except Exception as e:
             logger.warning(f"HDF5 flush error: {e}")
@@ -1422,9 +1947,11 @@ class DataManager:
                 if self._images_dataset is not None:
                     actual = self.frame_count
                     current_alloc = self._images_dataset.shape[0]
-                    if actual < current_alloc:
+                    # != rather than <: frames dropped at the very end may lie
+                    # past a grown dataset; their slots still need to exist
+                    if actual != current_alloc:
                         logger.info(
-                            f"Truncating images dataset from {current_alloc} to {actual} frames"
+                            f"Resizing images dataset from {current_alloc} to {actual} frames"
                         )
                         self._images_dataset.resize((actual,) + self._image_shape)  # type: ignore[operator]
                     self.hdf5_file["images"].attrs["actual_frames"] = actual
@@ -1436,24 +1963,20 @@ class DataManager:
                     ts_group.attrs["dataset_count"] = ts_stats["dataset_count"]
                     ts_group.attrs["trimmed"] = True
 
-                # Final flush
-                self.flush_file()
-
                 logger.info(f"Recording finalized successfully ({self.frame_count} frames)")
 
                 # Close HDF5 file to allow external access
                 logger.info("Closing HDF5 file to allow external access...")
 
-                # Flush and close timeseries writer
-                if self._ts_writer:
-                    self._ts_writer.flush()
-                    self._ts_writer = None
+                # Staged rows were written by trim above
+                self._ts_writer = None
 
-                # Close HDF5 file
+                # Close HDF5 file (close() flushes it; a flush right before
+                # would repeat that work), then make the finished file durable
                 if self.hdf5_file:
-                    self.hdf5_file.flush()
                     self.hdf5_file.close()
                     self.hdf5_file = None
+                    _fsync_path(self.current_filepath)  # type: ignore[arg-type]
                     logger.info("HDF5 file closed - ready for external analysis")
 
                 return True
@@ -1471,11 +1994,12 @@ class DataManager:
 
             with self._hdf5_lock:
                 if self._ts_writer:
-                    self._ts_writer.flush()
+                    # Writes the partial staging buffer, then drops the
+                    # pre-allocated tail; close() below flushes everything
+                    self._ts_writer.trim_to_actual_size()
                     self._ts_writer = None
 
                 if self.hdf5_file:
-                    self.hdf5_file.flush()
                     self.hdf5_file.close()
                     self.hdf5_file = None
 
@@ -1520,6 +2044,7 @@ class DataManager:
                 "queue_depth": self._async_writer._queue.qsize(),
                 "peak_queue_depth": self._async_writer._max_queue_depth,
                 "write_errors": self._async_writer.write_errors,
+                "dropped_frames": self._async_writer.dropped_frames,
             }
 
         return stats
@@ -1559,48 +2084,102 @@ def load_recording_info(filepath: str) -> Optional[dict]:
         return None
 
 
-def get_recording_summary(filepath: str) -> dict:
-    """Get summary of HDF5 recording"""
+def get_timeseries_units(filepath: str) -> dict:
+    """
+    Load {dataset: unit} for the /timeseries group.
+
+    Reads the "units_json" attribute (file_version >= 5.2) and falls back to
+    legacy per-field "units_<field>" attributes.
+    """
     try:
         with h5py.File(filepath, "r") as f:
-            summary = {
-                "filepath": filepath,
-                "file_size_mb": Path(filepath).stat().st_size / (1024 * 1024),
-                "created": f.attrs.get("created", 0),
-                "experiment_name": f.attrs.get("experiment_name", "Unknown"),
-                "file_version": f.attrs.get("file_version", "Unknown"),
-                "telemetry_mode": f.attrs.get("telemetry_mode", "Unknown"),
-                "total_frames": f.attrs.get("actual_frames", 0),
-                "phase_support": f.attrs.get("phase_support", False),
-                "groups": list(f.keys()),
-            }
-
-            if "images" in f:
-                img_grp = f["images"]
-                if "frames" in img_grp:
-                    # New format (v5.1): single pre-allocated 3D dataset
-                    summary["image_count"] = img_grp["frames"].shape[0]
-                    summary["image_format"] = "preallocated_3d"
-                    summary["image_shape"] = list(img_grp["frames"].shape[1:])
-                else:
-                    # Old format: individual frame_XXXXXX datasets
-                    summary["image_count"] = len(img_grp.keys())
-                    summary["image_format"] = "individual_datasets_legacy"
-
-            if "timeseries" in f:
-                ts = f["timeseries"]
-                summary["timeseries_datasets"] = list(ts.keys())
-                summary["timeseries_count"] = len(ts.keys())
-                if "written_frames" in ts.attrs:
-                    summary["timeseries_frames"] = ts.attrs["written_frames"]
+            if "timeseries" not in f:
+                return {}
+            attrs = f["timeseries"].attrs
+            if "units_json" in attrs:
+                return json.loads(attrs["units_json"])
+            return {key[len("units_") :]: attrs[key] for key in attrs if key.startswith("units_")}
+    except Exception as e:
+        logger.error(f"Failed to load timeseries units: {e}")
+        return {}
 
-            if "phase_analysis" in f:
-                pa = f["phase_analysis"]
-                summary["phase_transitions"] = pa.attrs.get("total_transitions", 0)
-                summary["cycles_completed"] = pa.attrs.get("cycles_completed", 0)
 
-            return summary
+def get_recording_summary(filepath: str) -> dict:
+    """
+    Get summary of HDF5 recording.
 
+    Files unchanged since a previous call (same mtime and size) are answered
+    from a small LRU cache instead of being reopened. Each call returns its
+    own dict (and lists), so callers may modify the result.
+    """
+    try:
+        st = os.stat(filepath)
+        cached = _read_recording_summary(str(filepath), st.st_mtime_ns, st.st_size)
+        summary = {
+            key: list(value) if isinstance(value, tuple) else value for key, value in cached.items()
+        }
+        summary["filepath"] = filepath
+        return summary
     except Exception as e:
         logger.error(f"Failed to get recording summary: {e}")
         return {"error": str(e)}
+
+
+@functools.lru_cache(maxsize=16)
+def _read_recording_summary(filepath: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    """
+    Summary of one file version; mtime_ns and size are only the cache key.
+
+    The cached value is shared, so it is kept read-only (sequences as
+    tuples); get_recording_summary() hands out copies.
+    """
+    with h5py.File(filepath, "r") as f:
+        # One attribute-name iteration up front, instead of an existence
+        # check per key; only the attributes used below are read
+        attrs = f.attrs
+        root_names = set(attrs)
+
+        def root_attr(name: str, default: Any) -> Any:
+            return attrs[name] if name in root_names else default
+
+        summary = {
+            "filepath": filepath,
+            # The driver already knows the size of the open file: no stat()
+            "file_size_mb": f.id.get_filesize() / (1024 * 1024),
+            "created": root_attr("created", 0),
+            "experiment_name": root_attr("experiment_name", "Unknown"),
+            "file_version": root_attr("file_version", "Unknown"),
+            "telemetry_mode": root_attr("telemetry_mode", "Unknown"),
+            "total_frames": root_attr("actual_frames", 0),
+            "phase_support": root_attr("phase_support", False),
+            "groups": tuple(f.keys()),
+        }
+
+        if "images" in f:
+            img_grp = f["images"]
+            if "frames" in img_grp:
+                # New format (v5.1): single pre-allocated 3D dataset
+                frames_shape = img_grp["frames"].shape
+                summary["image_count"] = frames_shape[0]
+                summary["image_format"] = "preallocated_3d"
+                summary["image_shape"] = tuple(frames_shape[1:])
+            else:
+                # Old format: individual frame_XXXXXX datasets. Counted
+                # from the group info, without listing 100k+ link names
+                summary["image_count"] = len(img_grp)
+                summary["image_format"] = "individual_datasets_legacy"
+
+        if "timeseries" in f:
+            ts = f["timeseries"]
+            ts_names = tuple(ts.keys())
+            summary["timeseries_datasets"] = ts_names
+            summary["timeseries_count"] = len(ts_names)
+            if "written_frames" in ts.attrs:
+                summary["timeseries_frames"] = ts.attrs["written_frames"]
+
+        if "phase_analysis" in f:
+            pa = f["phase_analysis"]
+            summary["phase_transitions"] = pa.attrs.get("total_transitions", 0)
+            summary["cycles_completed"] = pa.attrs.get("cycles_completed", 0)
+
+        return MappingProxyType(summary)
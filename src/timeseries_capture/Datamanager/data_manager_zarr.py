@@ -50,18 +50,140 @@ class TelemetryMode(IntEnum):
     COMPREHENSIVE = 3
 
 
+# ============================================================================
+# TIMESERIES FIELD MAP
+# ============================================================================
+
+# Sentinel for "key not present" — keeps legitimate 0 / 0.0 / False values,
+# which an `a or b` fallback chain would silently replace.
+_MISSING = object()
+
+# (array, ((source, key), ...), converter, default)
+#   source:  "fm" frame_metadata, "et" esp32_timing, "pt" python_timing,
+#            "row" value already resolved for an earlier array of this row
+#   default: used when no source key is present (None → wall-clock time)
+# Order matters: "row" sources must be resolved before they are referenced.
+_TIMESERIES_FIELD_MAP = (
+    ("frame_index", (("row", "frame_index"),), int, 0),
+    (
+        "recording_elapsed_sec",
+        (
+            ("fm", "recording_elapsed_sec"),
+            ("pt", "recording_elapsed_sec"),
+            ("pt", "capture_elapsed_sec"),
+        ),
+        float,
+        0.0,
+    ),
+    ("actual_intervals", (("pt", "actual_interval_sec"),), float, np.nan),
+    ("expected_intervals", (("pt", "expected_interval_sec"),), float, 5.0),
+    ("temperature_celsius", (("et", "temperature_celsius"), ("et", "temperature")), float, np.nan),
+    ("humidity_percent", (("et", "humidity_percent"), ("et", "humidity")), float, np.nan),
+    ("led_type_str", (("et", "led_type_used"), ("fm", "led_type")), str, ""),
+    ("ir_led_power", (("fm", "ir_led_power"),), int, -1),
+    ("white_led_power", (("fm", "white_led_power"),), int, -1),
+    ("sync_success", (("et", "sync_success"),), bool, True),
+    ("phase_str", (("fm", "phase"), ("fm", "current_phase")), str, "continuous"),
+    ("cycle_number", (("fm", "cycle_number"),), int, 0),
+    (
+        "frame_mean_intensity",
+        (("fm", "frame_mean_intensity"), ("fm", "frame_mean")),
+        float,
+        0.0,
+    ),
+    # STANDARD
+    ("phase_transition", (("fm", "phase_transition"),), bool, False),
+    ("capture_method", (("fm", "capture_method"),), str, "unknown"),
+    ("cumulative_drift_sec", (("pt", "cumulative_drift_sec"),), float, 0.0),
+    ("frame_drift_sec", (("fm", "frame_drift_sec"),), float, np.nan),
+    ("segment_index", (("fm", "segment_index"),), int, 0),
+    ("segment_label", (("fm", "segment_label"),), str, ""),
+    # COMPREHENSIVE
+    (
+        "capture_timestamps",
+        (("pt", "capture_timestamp_absolute"), ("fm", "timestamp")),
+        float,
+        None,
+    ),
+    (
+        "operation_start_absolute",
+        (("pt", "operation_start_absolute"), ("row", "capture_timestamps")),
+        float,
+        None,
+    ),
+    (
+        "operation_end_absolute",
+        (("pt", "operation_end_absolute"), ("row", "capture_timestamps")),
+        float,
+        None,
+    ),
+    ("expected_timestamps", (("pt", "expected_time"), ("row", "capture_timestamps")), float, None),
+    (
+        "capture_elapsed_sec",
+        (("pt", "capture_elapsed_sec"), ("row", "recording_elapsed_sec")),
+        float,
+        0.0,
+    ),
+    ("capture_overhead_sec", (("pt", "capture_overhead_sec"),), float, np.nan),
+    ("capture_delay_sec", (("fm", "capture_delay_sec"),), float, np.nan),
+    ("temperature", (("row", "temperature_celsius"),), float, np.nan),
+    ("humidity", (("row", "humidity_percent"),), float, np.nan),
+    ("led_sync_success", (("row", "sync_success"),), bool, True),
+    ("transition_count", (("fm", "transition_count"),), int, 0),
+    ("frame_mean", (("row", "frame_mean_intensity"),), float, 0.0),
+    ("sync_quality", (("fm", "sync_quality"),), str, "excellent"),
+    ("stabilization_ms", (("et", "led_stabilization_ms"),), int, -1),
+    ("capture_delay_ms", (("et", "capture_delay_ms"),), int, -1),
+    ("camera_trigger_latency_ms", (("et", "camera_trigger_latency_ms"),), int, -1),
+)
+
+_SOURCE_INDEX = {"fm": 0, "et": 1, "pt": 2, "row": 3}
+
+
+def _unsigned_missing_value(default, dtype) -> int | None:
+    """
+    Missing-data marker for an unsigned array whose default is -1, else None.
+
+    Unsigned arrays cannot hold -1 and use their maximum instead (255 for
+    the uint8 LED powers, which are 0-100 %), recorded in the array's
+    "missing_value" attribute as in the HDF5 writer.
+    """
+    if type(default) is int and default == -1 and np.dtype(dtype).kind == "u":
+        return int(np.iinfo(dtype).max)
+    return None
+
+
 # ============================================================================
 # ZARR TIMESERIES WRITER
 # ============================================================================
 
 
 class ZarrTimeseriesWriter:
-    """Writes per-frame telemetry into a Zarr group as 1-D arrays."""
+    """
+    Writes per-frame telemetry into a Zarr group as 1-D arrays.
+
+    Rows are staged in one in-memory column per array (struct of arrays,
+    one Zarr chunk long) and written as slabs: a full chunk at once, or the
+    rows staged so far on flush(). Every Zarr write is a read-modify-write of
+    a whole chunk, so writing one element per array per frame cost a chunk
+    rewrite per field and frame.
+
+    Only the AsyncZarrWriter worker calls append(). append(), flush() and
+    trim_to_actual_size() still take the RLock, like the HDF5
+    ChunkedTimeseriesWriter: flush() is public and must not write a slab or
+    move the staging window halfway through a row. The lock is uncontended
+    on the per-frame path.
+    """
 
     LED_TYPE_ENUM = {"ir": 0, "white": 1}
     PHASE_ENUM = {"dark": 0, "light": 1, "continuous": 2}
 
-    def __init__(self, group, chunk_size: int = 512, mode: TelemetryMode = TelemetryMode.STANDARD):
+    def __init__(
+        self,
+        group,
+        chunk_size: int = 512,
+        mode: TelemetryMode = TelemetryMode.STANDARD,
+    ):
         self.g = group
         self.chunk_size = int(chunk_size)
         self.mode = mode
@@ -102,9 +224,11 @@ class ZarrTimeseriesWriter:
             "frame_drift": np.float32,
             "capture_overhead_sec": np.float32,
             "capture_delay_sec": np.float32,
-            "stabilization_ms": np.float32,
-            "capture_delay_ms": np.uint8,
-            "camera_trigger_latency_ms": np.uint8,
+            # Whole milliseconds: int16 holds up to ~32 s and the -1 "missing"
+            # marker (uint8 could neither store -1 nor exposures >255 ms)
+            "stabilization_ms": np.int16,
+            "capture_delay_ms": np.int16,
+            "camera_trigger_latency_ms": np.int16,
             "temperature": np.float32,
             "humidity": np.float32,
             "led_sync_success": np.bool_,  # binary flag
@@ -120,6 +244,8 @@ class ZarrTimeseriesWriter:
         else:
             fields = {**minimal_fields, **standard_fields, **comprehensive_fields}
 
+        defaults = {name: default for name, _, _, default in _TIMESERIES_FIELD_MAP}
+
         with self._lock:
             for name, dtype in fields.items():
                 if name in self.g:
@@ -139,110 +265,120 @@ class ZarrTimeseriesWriter:
                             chunks=(self.chunk_size,),
                             dtype=dtype,
                         )
+                        missing_value = _unsigned_missing_value(defaults.get(name), dtype)
+                        if missing_value is not None:
+                            self.arrays[name].attrs["missing_value"] = missing_value
+
+        # Staging columns, one chunk long, in each array's own dtype. Slot 0
+        # is row _chunk_start; slots [0, _flushed) are already written.
+        self._columns = {
+            name: np.empty(self.chunk_size, dtype=arr.dtype) for name, arr in self.arrays.items()
+        }
+        self._chunk_start = self.written_frames
+        self._flushed = 0
+
+        # Resolution plan for this mode: fields with an array, plus the ones
+        # only needed as a row fallback for a later field (array None).
+        # float() is dropped (converter None) where the array is float-typed
+        # or absent: the array coerces on assignment.
+        needed = set(self.arrays)
+        plan = []
+        for name, keys, convert, default in reversed(_TIMESERIES_FIELD_MAP):
+            if name not in needed:
+                continue
+            needed.update(key for src, key in keys if src == "row")
+            keys = tuple((_SOURCE_INDEX[src], key) for src, key in keys)
+            arr = self.arrays.get(name)
+            if convert is float and (arr is None or arr.dtype.kind == "f"):
+                convert = None
+            if arr is not None:
+                missing_value = _unsigned_missing_value(default, arr.dtype)
+                if missing_value is not None:
+                    default = missing_value
+            column = self._columns.get(name)
+            plan.append((name, keys, convert, default, column))
+        self._field_plan = tuple(reversed(plan))
+
+        # Rows every array can hold; slab writes only touch array shapes
+        # when they cross it
+        self._capacity = min((arr.shape[0] for arr in self.arrays.values()), default=0)
 
         logger.info(f"Zarr timeseries writer: {len(self.arrays)} arrays, mode={mode.name}")
 
-    def _set(self, name, index, value):
-        if name not in self.arrays:
-            return
-        arr = self.arrays[name]
-        if index >= arr.shape[0]:
-            arr.resize((index + self.chunk_size,))
-        arr[index] = value
-
     def append(
         self, frame_index: int, frame_metadata: dict, esp32_timing: dict, python_timing: dict
     ):
         with self._lock:
             i = self.written_frames
-            # Grow all arrays if needed
-            for arr in self.arrays.values():
-                if i >= arr.shape[0]:
-                    arr.resize((i + self.chunk_size,))
-
-            fm = frame_metadata or {}
-            et = esp32_timing or {}
-            pt = python_timing or {}
-
-            def s(key, value):
-                if key in self.arrays:
-                    self.arrays[key][i] = value
-
-            s("frame_index", int(frame_index))
-
-            timestamp_abs = float(
-                pt.get("capture_timestamp_absolute") or fm.get("timestamp") or time.time()
-            )
-            recording_elapsed = float(
-                fm.get("recording_elapsed_sec")
-                or pt.get("recording_elapsed_sec")
-                or pt.get("capture_elapsed_sec")
-                or 0.0
+            k = i - self._chunk_start  # staging slot of this row
+
+            resolved = {"frame_index": frame_index}
+            # Bound .get per source, indexed by _SOURCE_INDEX in the field loop
+            getters = (
+                (frame_metadata or {}).get,
+                (esp32_timing or {}).get,
+                (python_timing or {}).get,
+                resolved.get,
             )
-            s("recording_elapsed_sec", recording_elapsed)
-
-            s("actual_intervals", float(pt.get("actual_interval_sec", np.nan)))
-            s("expected_intervals", float(pt.get("expected_interval_sec", 5.0)))
-
-            temp = float(et.get("temperature_celsius") or et.get("temperature", np.nan))
-            humidity = float(et.get("humidity_percent") or et.get("humidity", np.nan))
-            s("temperature_celsius", temp)
-            s("humidity_percent", humidity)
-
-            led_type_str = str(et.get("led_type_used") or fm.get("led_type", ""))
-            ir_led_power = int(fm.get("ir_led_power", -1))
-            white_led_power = int(fm.get("white_led_power", -1))
-            s("ir_led_power", ir_led_power)
-            s("white_led_power", white_led_power)
-            s("led_type_str", led_type_str)
-
-            sync_success = bool(et.get("sync_success", True))
-            s("sync_success", sync_success)
-
-            phase_str = str(fm.get("phase") or fm.get("current_phase", "continuous"))
-            s("phase_str", phase_str)
-            s("cycle_number", int(fm.get("cycle_number", 0)))
-
-            frame_mean = float(fm.get("frame_mean_intensity") or fm.get("frame_mean", 0.0))
-            s("frame_mean_intensity", frame_mean)
-
-            if self.mode >= TelemetryMode.STANDARD:
-                s("phase_transition", bool(fm.get("phase_transition", False)))
-                s("capture_method", str(fm.get("capture_method", "unknown")))
-                s("cumulative_drift_sec", float(pt.get("cumulative_drift_sec", 0.0)))
-                s("frame_drift_sec", float(fm.get("frame_drift_sec", np.nan)))
-                s("segment_index", int(fm.get("segment_index", 0)))
-                s("segment_label", str(fm.get("segment_label", "")))
-
-            if self.mode == TelemetryMode.COMPREHENSIVE:
-                s(
-                    "operation_start_absolute",
-                    float(pt.get("operation_start_absolute", timestamp_abs)),
-                )
-                s("operation_end_absolute", float(pt.get("operation_end_absolute", timestamp_abs)))
-                s("expected_timestamps", float(pt.get("expected_time", timestamp_abs)))
-                s("capture_timestamps", timestamp_abs)
-                s("capture_elapsed_sec", float(pt.get("capture_elapsed_sec", recording_elapsed)))
-                s("capture_overhead_sec", float(pt.get("capture_overhead_sec", np.nan)))
-                s("capture_delay_sec", float(fm.get("capture_delay_sec", np.nan)))
-                s("temperature", temp)
-                s("humidity", humidity)
-                s("led_sync_success", sync_success)
-                s("transition_count", int(fm.get("transition_count", 0)))
-                s("frame_mean", frame_mean)
-                s("sync_quality", str(fm.get("sync_quality", "excellent")))
-                s("stabilization_ms", float(et.get("led_stabilization_ms", -1)))
-                s("capture_delay_ms", int(et.get("capture_delay_ms", -1)))
-                s("camera_trigger_latency_ms", int(et.get("camera_trigger_latency_ms", -1)))
-
-            self.written_frames += 1
+            now = None  # wall-clock fallback, read at most once per row
+            missing = _MISSING
+
+            # Resolve every field from its first present source key (see
+            # _TIMESERIES_FIELD_MAP); 0 / 0.0 / False count as present
+            for name, keys, convert, default, column in self._field_plan:
+                for src, key in keys:
+                    value = getters[src](key, missing)
+                    if value is not missing and value is not None:
+                        break
+                else:
+                    if default is None:
+                        if now is None:
+                            now = time.time()
+                        default = now
+                    value = default
+                if convert is not None:
+                    value = convert(value)
+                resolved[name] = value
+                if column is not None:
+                    column[k] = value
+
+            self.written_frames = i + 1
+            if k + 1 == self.chunk_size:
+                self._write_staged_rows()
+
+    def _write_staged_rows(self):
+        """Write staged rows not yet on disk (one slab per array)"""
+        n = self.written_frames - self._chunk_start
+        lo = self._flushed
+        if n > lo:
+            start = self._chunk_start
+            end = start + n
+            # Grow all arrays if needed
+            if end > self._capacity:
+                for arr in self.arrays.values():
+                    if end > arr.shape[0]:
+                        arr.resize((start + self.chunk_size,))
+                self._capacity = min(arr.shape[0] for arr in self.arrays.values())
+            for name, arr in self.arrays.items():
+                arr[start + lo : end] = self._columns[name][lo:n]
+            self._flushed = n
+        if n == self.chunk_size:
+            self._chunk_start = self.written_frames
+            self._flushed = 0
+
+    def flush(self):
+        """Write the rows staged so far (the current chunk stays staged)"""
+        with self._lock:
+            self._write_staged_rows()
 
     def trim_to_actual_size(self):
         """Trim all arrays to actually written frames."""
         with self._lock:
+            self._write_staged_rows()
             for arr in self.arrays.values():
                 if arr.shape[0] > self.written_frames:
                     arr.resize((self.written_frames,))
+            self._capacity = self.written_frames
         logger.info(f"Zarr timeseries trimmed to {self.written_frames} frames")
 
     def get_stats(self) -> dict:
@@ -379,6 +515,8 @@ class AsyncZarrWriter:
 
                 if frames_since_update >= self._update_interval:
                     try:
+                        # Staged rows first: written_frames must not run ahead of the data
+                        self._ts_writer.flush()
                         self._root.attrs["written_frames"] = self.frames_written
                     except Exception:
                         pass
@@ -392,6 +530,10 @@ class AsyncZarrWriter:
             finally:
                 self._queue.task_done()
 
+        try:
+            self._ts_writer.flush()
+        except Exception as exc:
+            logger.error(f"AsyncZarrWriter: final timeseries flush error: {exc}")
         logger.debug("AsyncZarrWriter worker thread stopped")
 
 
@@ -481,13 +623,17 @@ class DataManagerZarr:
                 self._root.require_group("images")
                 self._root.require_group("timeseries")
 
-                # Root attributes
-                self._root.attrs["created"] = time.time()
-                self._root.attrs["created_human"] = time.strftime("%Y-%m-%d %H:%M:%S")
-                self._root.attrs["experiment_name"] = experiment_name
-                self._root.attrs["file_version"] = "1.0-zarr"
-                self._root.attrs["software"] = "nematostella-timelapse-zarr"
-                self._root.attrs["telemetry_mode"] = self.telemetry_mode.name
+                # Root attributes — one update() so .zattrs is written once, not per key
+                self._root.attrs.update(
+                    {
+                        "created": time.time(),
+                        "created_human": time.strftime("%Y-%m-%d %H:%M:%S"),
+                        "experiment_name": experiment_name,
+                        "file_version": "1.0-zarr",
+                        "software": "nematostella-timelapse-zarr",
+                        "telemetry_mode": self.telemetry_mode.name,
+                    }
+                )
 
                 self.frame_count = 0
                 self.recording_start_time = time.time()
@@ -650,16 +796,13 @@ class DataManagerZarr:
             chunks=(self.img_chunk_frames, h, w),
             dtype=dtype,
         )
-        self._frames_array.attrs["frame_height"] = h
-        self._frames_array.attrs["frame_width"] = w
-        self._frames_array.attrs["frame_dtype"] = str(dtype)
-
-        self._root["images"].attrs["frame_shape"] = [h, w]
-        self._root["images"].attrs["frame_dtype"] = str(dtype)
+        self._frames_array.attrs.update(
+            {"frame_height": h, "frame_width": w, "frame_dtype": str(dtype)}
+        )
+        self._root["images"].attrs.update({"frame_shape": [h, w], "frame_dtype": str(dtype)})
 
         # Also set root-level frame_shape for analysis plugin
-        self._root.attrs["frame_height"] = h
-        self._root.attrs["frame_width"] = w
+        self._root.attrs.update({"frame_height": h, "frame_width": w})
 
         logger.info(
             f"Zarr images array pre-allocated: ({self._images_max_frames}, {h}, {w}) dtype={dtype}"
@@ -670,8 +813,12 @@ class DataManagerZarr:
         self._ts_writer = ZarrTimeseriesWriter(
             ts_group, chunk_size=self.ts_chunk_size, mode=self.telemetry_mode
         )
-        ts_group.attrs["description"] = "Zarr timeseries telemetry"
-        ts_group.attrs["telemetry_mode"] = self.telemetry_mode.name
+        ts_group.attrs.update(
+            {
+                "description": "Zarr timeseries telemetry",
+                "telemetry_mode": self.telemetry_mode.name,
+            }
+        )
         logger.info("Zarr timeseries writer created")
 
     def _calculate_timing_metrics(
@@ -781,20 +928,24 @@ class DataManagerZarr:
                 if self._root is None:
                     return False
 
-                self._root.attrs["actual_frames"] = self.frame_count
-                self._root.attrs["finalized"] = True
-                self._root.attrs["finalized_time"] = time.time()
-                self._root.attrs["total_phase_transitions"] = self._transition_count
-
                 self.recording_metadata.update(final_info)
                 self.recording_metadata["actual_frames"] = self.frame_count
 
-                for k, v in self.recording_metadata.items():
-                    try:
-                        if isinstance(v, (str, int, float, bool)):
-                            self._root.attrs[k] = v
-                    except Exception:
-                        pass
+                # Collect everything and write .zattrs once instead of once per key
+                final_attrs = {
+                    k: v
+                    for k, v in self.recording_metadata.items()
+                    if isinstance(v, (str, int, float, bool))
+                }
+                final_attrs.update(
+                    {
+                        "actual_frames": self.frame_count,
+                        "finalized": True,
+                        "finalized_time": time.time(),
+                        "total_phase_transitions": self._transition_count,
+                    }
+                )
+                self._root.attrs.update(final_attrs)
 
                 # Trim images array
                 if (
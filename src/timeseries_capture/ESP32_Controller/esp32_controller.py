@@ -31,6 +31,14 @@ from .esp32_state import ESP32State
 
 logger = logging.getLogger(__name__)
 
+# LED type → (SELECT command bytes, expected response), built once at import.
+# select_led_type() runs once per frame, so one dict lookup replaces the
+# repeated .lower() + if/elif comparisons.
+_LED_SELECT_TABLE = {
+    "ir": (CommandBuilder.build_select_led_ir(), Responses.LED_IR_SELECTED),
+    "white": (CommandBuilder.build_select_led_white(), Responses.LED_WHITE_SELECTED),
+}
+
 
 class ESP32Controller:
     """
@@ -154,16 +162,12 @@ class ESP32Controller:
         # Clear buffers
         self.comm.clear_buffers()
 
-        # Build and send command
-        if led_type.lower() == "ir":
-            cmd = CommandBuilder.build_select_led_ir()
-            expected_response = Responses.LED_IR_SELECTED
-        elif led_type.lower() == "white":
-            cmd = CommandBuilder.build_select_led_white()
-            expected_response = Responses.LED_WHITE_SELECTED
-        else:
+        # Look up command (callers normally pass lowercase already)
+        entry = _LED_SELECT_TABLE.get(led_type) or _LED_SELECT_TABLE.get(led_type.lower())
+        if entry is None:
             logger.error(f"Invalid LED type: {led_type}")
             return False
+        cmd, expected_response = entry
 
         # Send command
         if not self.comm.send_bytes(cmd):
@@ -182,8 +182,12 @@ class RecordingManager(QObject):
             else:
                 self.data_manager = DataManager(
                     telemetry_mode=TelemetryMode.STANDARD,
-                    chunk_size=512,
+                    chunk_size=4096,
                     save_as_uint8=getattr(config, "save_as_uint8", False),
+                    block_when_queue_full=getattr(config, "block_when_queue_full", True),
+                    release_page_cache=getattr(config, "release_page_cache", False),
+                    flush_interval=getattr(config, "flush_interval_frames", 10),
+                    fsync_interval=getattr(config, "fsync_interval_frames", 500),
                 )
                 logger.info("Using HDF5 data manager")
 
@@ -245,13 +249,6 @@ class RecordingManager(QObject):
             # ================================================================
             # If using dual LED mode, set BOTH LED powers before recording starts
             # Otherwise the white LED power will be 0% and won't turn on!
-            print("\n" + "=" * 60)
-            print("LED POWER INITIALIZATION")
-            print(f"Phase enabled: {config.phase_enabled}")
-            print(f"Dual light phase: {config.dual_light_phase}")
-            print(f"Start with light: {config.start_with_light}")
-            print("=" * 60 + "\n")
-
             logger.info("=" * 60)
             logger.info("LED POWER INITIALIZATION")
             logger.info(f"Phase enabled: {config.phase_enabled}")
@@ -261,11 +258,6 @@ class RecordingManager(QObject):
 
             if config.phase_enabled:
                 # PHASE RECORDING: Use per-phase LED powers for intensity matching
-                print("🔆 Initializing PER-PHASE LED powers")
-                print(f"   Dark phase IR power: {config.dark_phase_ir_power}%")
-                print(f"   Light phase IR power: {config.light_phase_ir_power}%")
-                print(f"   Light phase White power: {config.light_phase_white_power}%\n")
-
                 logger.info("🔆 Initializing PER-PHASE LED powers")
                 logger.info(f"   Dark phase IR power: {config.dark_phase_ir_power}%")
                 logger.info(f"   Light phase IR power: {config.light_phase_ir_power}%")
@@ -273,9 +265,8 @@ class RecordingManager(QObject):
 
                 # NOTE: LED powers will be set dynamically per frame based on current phase
                 # This is handled in _capture_single_frame() by calling _set_phase_led_powers()
-                print("✅ Per-phase LED power configuration ready")
-                print("   Powers will be set dynamically based on current phase\n")
                 logger.info("✅ Per-phase LED power configuration ready")
+                logger.info("   Powers will be set dynamically based on current phase")
 
             else:
                 # CONTINUOUS RECORDING: Use legacy single LED powers
@@ -873,14 +864,12 @@ class RecordingManager(QObject):
                 # HIGH_PRIORITY_CLASS = 0x00000080
                 ctypes.windll.kernel32.SetPriorityClass(handle, 0x00000080)
                 logger.info("✅ Process priority set to HIGH for stable timing")
-                print("✅ Process priority set to HIGH for stable timing")
             else:
                 # Linux/macOS: use nice
                 os.nice(-10)  # Higher priority (requires root on Linux)
                 logger.info("✅ Process nice value set to -10")
         except Exception as e:
             logger.warning(f"⚠️ Could not set high priority: {e}")
-            print(f"⚠️ Could not set high priority: {e}")
 
     def _restore_normal_priority(self):
         """Restore normal process priority after recording"""
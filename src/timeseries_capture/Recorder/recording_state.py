@@ -79,6 +79,21 @@ class RecordingConfig:
     # Bit depth: convert 12-bit HIK frames to uint8 before saving (halves file size)
     save_as_uint8: bool = False
 
+    # HDF5 write queue: wait for disk when it falls behind (True), or drop the
+    # frame and keep the capture cadence (False); dropped frames keep a
+    # timeseries row marked capture_method="dropped"
+    block_when_queue_full: bool = True
+
+    # HDF5: drop the recording's pages from the OS page cache after each
+    # periodic flush (keeps multi-day recordings from evicting other cached
+    # data); leave off if the file is read back while recording
+    release_page_cache: bool = False
+
+    # HDF5 flush cadence: flush every N frames, fsync at the first flush
+    # after every M frames (0 = never)
+    flush_interval_frames: int = 10
+    fsync_interval_frames: int = 500
+
 
 # ============================================================================
 # EXPERIMENT SCHEDULE  (optional, does not change RecordingConfig)
@@ -157,6 +172,10 @@ class ExperimentSchedule:
     output_dir: str = ""
     output_format: str = "hdf5"
     save_as_uint8: bool = False
+    block_when_queue_full: bool = True
+    release_page_cache: bool = False
+    flush_interval_frames: int = 10
+    fsync_interval_frames: int = 500
     brightness_validation_threshold: float = 10.0
     use_full_frame_for_validation: bool = True
     roi_fraction: float = 0.75
@@ -197,6 +216,10 @@ class ExperimentSchedule:
             output_dir=self.output_dir,
             output_format=self.output_format,
             save_as_uint8=self.save_as_uint8,
+            block_when_queue_full=self.block_when_queue_full,
+            release_page_cache=self.release_page_cache,
+            flush_interval_frames=self.flush_interval_frames,
+            fsync_interval_frames=self.fsync_interval_frames,
             brightness_validation_threshold=self.brightness_validation_threshold,
             use_full_frame_for_validation=self.use_full_frame_for_validation,
             roi_fraction=self.roi_fraction,
@@ -213,6 +236,10 @@ class ExperimentSchedule:
             "output_dir": self.output_dir,
             "output_format": self.output_format,
             "save_as_uint8": self.save_as_uint8,
+            "block_when_queue_full": self.block_when_queue_full,
+            "release_page_cache": self.release_page_cache,
+            "flush_interval_frames": self.flush_interval_frames,
+            "fsync_interval_frames": self.fsync_interval_frames,
             "brightness_validation_threshold": self.brightness_validation_threshold,
             "use_full_frame_for_validation": self.use_full_frame_for_validation,
             "roi_fraction": self.roi_fraction,
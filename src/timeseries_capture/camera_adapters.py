@@ -13,6 +13,7 @@ Unterstützt:
 """
 
 import logging
+import weakref
 from abc import ABC, abstractmethod
 from typing import Optional
 
@@ -372,6 +373,10 @@ class NapariViewerCameraAdapter(CameraAdapter):
         # on the underlying ImSwitch detector.
         self._consecutive_zero_frames = 0
         self._zero_frame_reacq_threshold = 5
+        # ImSwitch DetectorsManager (weak reference) and the detector name in
+        # use, cached once found; see _get_imswitch_detector()
+        self._detectors_manager = None
+        self._detector_name = None
 
         logger.info(f"Napari Viewer Camera Adapter initialized (layer={layer_name})")
 
@@ -443,10 +448,13 @@ class NapariViewerCameraAdapter(CameraAdapter):
             # Store as last frame
             self._last_frame = frame
 
-            logger.debug(
-                f"Captured frame: dtype={frame.dtype}, shape={frame.shape}, "
-                f"min={frame.min()}, max={frame.max()}, mean={frame.mean():.1f}"
-            )
+            # Guarded: the f-string would run three full-frame reductions on
+            # the capture thread every frame even with DEBUG logging off
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Captured frame: dtype={frame.dtype}, shape={frame.shape}, "
+                    f"min={frame.min()}, max={frame.max()}, mean={frame.mean():.1f}"
+                )
 
             return frame
 
@@ -455,15 +463,33 @@ class NapariViewerCameraAdapter(CameraAdapter):
             # Return last frame as fallback
             return self._last_frame
 
-    def _flush_imswitch_camera(self) -> None:
+    def _get_imswitch_detector(self):
         """
-        Find the ImSwitch DetectorsManager via gc scan and call flushBuffers()
-        on the current detector to recover from the HIK SDK zero-frame state.
-        Frame reading remains through the napari layer to avoid threading conflicts.
+        First detector of the ImSwitch DetectorsManager, or None.
+
+        The manager is located by a gc scan and cached: gc.get_objects()
+        walks every tracked object in the process, which with napari and
+        ImSwitch loaded is slow enough to stall the capture thread if
+        repeated on every recovery or exposure query.
+
+        The cache holds only a weak reference and is revalidated on every
+        call: if ImSwitch has dropped the manager, or the detector used
+        last is no longer among its devices (camera reconnected or
+        reconfigured), the heap is scanned again.
         """
-        import time
+        manager = self._detectors_manager() if self._detectors_manager is not None else None
+        names = None
+        if manager is not None:
+            try:
+                names = manager.getAllDeviceNames()
+            except Exception:
+                names = None
+            if not names or (self._detector_name is not None and self._detector_name not in names):
+                logger.info("Cached ImSwitch detector is gone, searching again...")
+                manager = None
 
-        try:
+        if manager is None:
+            self._invalidate_imswitch_detector()
             import gc
 
             for obj in gc.get_objects():
@@ -471,26 +497,55 @@ class NapariViewerCameraAdapter(CameraAdapter):
                     type(obj).__name__ == "DetectorsManager"
                     and hasattr(obj, "_subManagers")
                     and hasattr(obj, "getAllDeviceNames")
+                    and obj.getAllDeviceNames()
                 ):
-                    names = obj.getAllDeviceNames()
-                    if not names:
-                        continue
-                    detector = obj[names[0]]
-                    if hasattr(detector, "flushBuffers"):
-                        detector.flushBuffers()
-                        logger.info("Camera buffer flushed via ImSwitch DetectorsManager")
-                        time.sleep(0.1)
-                    elif hasattr(detector, "stopAcquisition") and hasattr(
-                        detector, "startAcquisition"
-                    ):
-                        detector.stopAcquisition()
-                        time.sleep(0.2)
-                        detector.startAcquisition()
-                        logger.info("Camera acquisition restarted via ImSwitch DetectorsManager")
-                        time.sleep(0.2)
-                    return
+                    manager = obj
+                    break
+            else:
+                return None
+            try:
+                self._detectors_manager = weakref.ref(manager)
+            except TypeError:
+                # Not weak-referenceable: hold it strongly, still revalidated above
+                self._detectors_manager = lambda manager=manager: manager
+            names = manager.getAllDeviceNames()
+            if not names:
+                return None
+
+        if self._detector_name not in names:
+            self._detector_name = names[0]
+        return manager[self._detector_name]
+
+    def _invalidate_imswitch_detector(self) -> None:
+        """Drop the cached ImSwitch detector so the next lookup rescans."""
+        self._detectors_manager = None
+        self._detector_name = None
+
+    def _flush_imswitch_camera(self) -> None:
+        """
+        Call flushBuffers() on the ImSwitch detector to recover from the HIK
+        SDK zero-frame state.
+        Frame reading remains through the napari layer to avoid threading conflicts.
+        """
+        import time
+
+        try:
+            detector = self._get_imswitch_detector()
+            if detector is None:
+                return
+            if hasattr(detector, "flushBuffers"):
+                detector.flushBuffers()
+                logger.info("Camera buffer flushed via ImSwitch DetectorsManager")
+                time.sleep(0.1)
+            elif hasattr(detector, "stopAcquisition") and hasattr(detector, "startAcquisition"):
+                detector.stopAcquisition()
+                time.sleep(0.2)
+                detector.startAcquisition()
+                logger.info("Camera acquisition restarted via ImSwitch DetectorsManager")
+                time.sleep(0.2)
         except Exception as e:
             logger.warning(f"Camera buffer flush failed: {e}")
+            self._invalidate_imswitch_detector()
 
     def is_available(self) -> bool:
         """
@@ -515,6 +570,7 @@ class NapariViewerCameraAdapter(CameraAdapter):
         """
         logger.info("Forcing camera layer refresh...")
         self._cached_layer = None
+        self._invalidate_imswitch_detector()
         self._layer_search_count = 0
         layer = self._get_camera_layer()
 
@@ -551,31 +607,20 @@ class NapariViewerCameraAdapter(CameraAdapter):
         """
         Read camera exposure from the ImSwitch DetectorsManager.
 
-        Uses the same gc-scan approach as _flush_imswitch_camera() to locate
-        the active ImSwitch detector and calls getParameter("exposure") on it.
+        Uses the cached detector lookup shared with _flush_imswitch_camera()
+        and calls getParameter("exposure") on it.
         ImSwitch returns exposure in milliseconds (as displayed in its UI).
 
         Returns:
             Exposure time in ms, or 10.0 if the detector cannot be reached.
         """
         try:
-            import gc
-
-            for obj in gc.get_objects():
-                if (
-                    type(obj).__name__ == "DetectorsManager"
-                    and hasattr(obj, "_subManagers")
-                    and hasattr(obj, "getAllDeviceNames")
-                ):
-                    names = obj.getAllDeviceNames()
-                    if not names:
-                        continue
-                    detector = obj[names[0]]
-                    if hasattr(detector, "getParameter"):
-                        value = detector.getParameter("exposure")
-                        return float(value)
+            detector = self._get_imswitch_detector()
+            if detector is not None and hasattr(detector, "getParameter"):
+                return float(detector.getParameter("exposure"))
         except Exception as e:
-            logger.debug(f"get_exposure_ms via gc scan failed: {e}")
+            logger.debug(f"get_exposure_ms via ImSwitch detector failed: {e}")
+            self._invalidate_imswitch_detector()
         return 10.0  # fallback
 
     def _get_camera_layer(self):
@@ -0,0 +1,128 @@
+"""
+Tests for the HDF5 DataManager write-behind path.
+
+Run with:
+    python -m pytest tests/test_data_manager_hdf5.py
+"""
+
+import threading
+
+import h5py
+import numpy as np
+
+from timeseries_capture.Datamanager import data_manager_hdf5
+from timeseries_capture.Datamanager.data_manager_hdf5 import DataManager, TelemetryMode
+
+
+def _metadata(n: int) -> dict:
+    return {
+        "phase": "dark",
+        "phase_enabled": True,
+        "capture_method": "normal",
+        "capture_elapsed_sec": 5.0 * (n - 1),
+        "ir_led_power": 50,
+        "white_led_power": 0,
+    }
+
+
+def test_dropped_frames_keep_images_and_timeseries_aligned(tmp_path, monkeypatch):
+    """A full write queue drops frames without shifting rows against images."""
+    # Hold the worker on its first row so the queue (64 slots) fills up
+    gate = threading.Event()
+    append = data_manager_hdf5.ChunkedTimeseriesWriter.append
+
+    def gated_append(self, *args, **kwargs):
+        gate.wait(timeout=30)
+        return append(self, *args, **kwargs)
+
+    monkeypatch.setattr(data_manager_hdf5.ChunkedTimeseriesWriter, "append", gated_append)
+
+    mgr = DataManager(
+        telemetry_mode=TelemetryMode.STANDARD, chunk_size=16, block_when_queue_full=False
+    )
+    path = mgr.create_recording_file(str(tmp_path), "drops", timestamped=False)
+    mgr.set_recording_config({"interval_seconds": 5.0, "expected_frames": 50})
+
+    n_frames = 80
+    for n in range(1, n_frames + 1):
+        frame = np.full((32, 24), n, dtype=np.uint16)
+        assert mgr.save_frame(frame, n, _metadata(n))
+
+    dropped = mgr.get_stats()["write_queue"]["dropped_frames"]
+    assert dropped > 0
+
+    gate.set()
+    assert mgr.finalize_recording({})
+
+    with h5py.File(path, "r") as f:
+        images = f["images/frames"][:]
+        ts = f["timeseries"]
+        assert images.shape[0] == n_frames
+        for name in ts:
+            assert ts[name].shape == (n_frames,), name
+
+        assert (ts["frame_index"][:] == np.arange(n_frames)).all()
+
+        methods = ts["capture_method"].asstr()[:]
+        is_dropped = methods == "dropped"
+        assert is_dropped.sum() == dropped
+        assert not ts["sync_success"][:][is_dropped].any()
+
+        # Dropped rows keep the capture-side metadata of their frame
+        assert (ts["phase_str"][:] == b"dark").all()
+        assert (np.diff(ts["recording_elapsed_sec"][:]) > 0).all()
+
+        # Every kept row describes the image in its own slot; dropped slots are empty
+        slot_values = images[:, 0, 0]
+        kept = ~is_dropped
+        assert (slot_values[kept] == np.arange(1, n_frames + 1)[kept]).all()
+        assert (slot_values[is_dropped] == 0).all()
+        assert np.allclose(ts["frame_mean_intensity"][:][kept], slot_values[kept])
+
+
+def test_long_and_non_ascii_labels_are_truncated_with_warning(tmp_path, caplog):
+    """Fixed-length labels are cut deliberately; free-form text stays intact."""
+    mgr = DataManager(telemetry_mode=TelemetryMode.STANDARD, chunk_size=16)
+    path = mgr.create_recording_file(str(tmp_path), "labels", timestamped=False)
+    mgr.set_recording_config({"interval_seconds": 5.0, "expected_frames": 2})
+
+    metadata = _metadata(1)
+    metadata["phase"] = "pré-illumination-phase"
+    metadata["capture_method"] = "capture_failed_placeholder_replicated_again"
+    with caplog.at_level("WARNING", logger=data_manager_hdf5.__name__):
+        assert mgr.save_frame(np.zeros((32, 24), dtype=np.uint16), 1, metadata)
+        assert mgr.finalize_recording({})
+
+    with h5py.File(path, "r") as f:
+        ts = f["timeseries"]
+        assert ts["phase_str"].attrs["max_length"] == 16
+        assert ts["phase_str"][0] == b"pr?-illumination"
+        assert ts["capture_method"].asstr()[0] == metadata["capture_method"]
+    assert "pré-illumination-phase" in caplog.text
+
+
+def test_recording_summary_is_cached_copied_and_refreshed(tmp_path):
+    """Unchanged files come from the cache; a modified file is read again."""
+    mgr = DataManager(telemetry_mode=TelemetryMode.MINIMAL, chunk_size=16)
+    path = mgr.create_recording_file(str(tmp_path), "summary", timestamped=False)
+    mgr.set_recording_config({"interval_seconds": 5.0, "expected_frames": 2})
+    assert mgr.save_frame(np.zeros((32, 24), dtype=np.uint16), 1, _metadata(1))
+    assert mgr.finalize_recording({})
+    mgr.close_file()
+
+    summary = data_manager_hdf5.get_recording_summary(path)
+    assert summary["image_count"] == 1
+    assert isinstance(summary["groups"], list)
+
+    # Callers get their own copy: modifying it does not touch the cache
+    summary["image_count"] = 0
+    summary["groups"].append("scratch")
+    again = data_manager_hdf5.get_recording_summary(path)
+    assert again["image_count"] == 1
+    assert "scratch" not in again["groups"]
+
+    with h5py.File(path, "a") as f:
+        f.attrs["experiment_name"] = "renamed-after-the-fact"
+    assert data_manager_hdf5.get_recording_summary(path)["experiment_name"] == (
+        "renamed-after-the-fact"
+    )